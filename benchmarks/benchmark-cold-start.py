@@ -0,0 +1,64 @@
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+# Cold-start cost of the gene_sequence package: every case runs in a fresh
+# interpreter, the way a short-lived worker process would, and the wall time of
+# the whole process is recorded. "interpreter" is the floor every case pays.
+#
+#   python benchmarks/benchmark-cold-start.py --runs 30 --output cold-start.json
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CASES = [
+    ("interpreter", ["-c", "pass"]),
+    ("import gene_sequence", ["-c", "import gene_sequence"]),
+    ("import GeneSequence", ["-c", "from gene_sequence import GeneSequence"]),
+    ("import GeneBoosterRunner", ["-c", "from gene_sequence import GeneBoosterRunner"]),
+    ("import every name", ["-c", "import gene_sequence; [getattr(gene_sequence, name) for name in gene_sequence.__all__]"]),
+    ("cli --help", ["-m", "gene_sequence", "--help"]),
+    ("cli sample solve", ["-m", "gene_sequence"]),
+]
+
+
+def time_case(arguments, runs):
+    environment = dict(os.environ)
+    environment["PYTHONPATH"] = ROOT + os.pathsep + environment.get("PYTHONPATH", "")
+    environment["PYTHONDONTWRITEBYTECODE"] = "0"
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        subprocess.run([sys.executable] + arguments, env = environment, stdout = subprocess.DEVNULL, check = True)
+        timings.append(time.perf_counter() - started)
+    return timings
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description = "Measure interpreter start-up plus gene_sequence import and CLI time.")
+    parser.add_argument("--runs", type = int, default = 20, help = "processes started per case")
+    parser.add_argument("--output", metavar = "PATH", help = "write the report as JSON (default stdout)")
+    args = parser.parse_args()
+
+    # One untimed run per case so bytecode caches exist before anything is timed.
+    for name, arguments in CASES:
+        time_case(arguments, 1)
+
+    results = []
+    for name, arguments in CASES:
+        timings = time_case(arguments, args.runs)
+        results.append({"case": name, "median_seconds": round(statistics.median(timings), 6), "min_seconds": round(min(timings), 6)})
+        print("%-26s median %8.2f ms   min %8.2f ms" % (name, statistics.median(timings) * 1000, min(timings) * 1000), file = sys.stderr)
+
+    report = {"python": platform.python_version(), "machine": platform.machine(), "runs": args.runs, "results": results}
+    if args.output is None:
+        json.dump(report, sys.stdout, indent = 2)
+        print()
+    else:
+        with open(args.output, "w") as output_file:
+            json.dump(report, output_file, indent = 2)
+            output_file.write("\n")
@@ -0,0 +1,250 @@
+import argparse
+import contextlib
+import importlib.util
+import io
+import json
+import os
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+# Benchmarks every solver in the repo on the same generated instances:
+#   engine                             gene_sequence package
+#   minimax-alpha-beta-pruning         code-dump/minimax-alpha-beta-pruning.py
+#   alpha-beta-with-utility            code-dump/alpha-beta-with-utility.py
+#   alpha-beta-with-utility-and-booster code-dump/alpha-beta-with-utility-and-booster.py
+#
+# Each configuration (pool size, duplicate ratio, target length / pool length,
+# booster on or off) gets one instance seeded from the configuration itself, so a
+# run is reproducible. Wall time is the best of --repeat runs; nodes and peak memory
+# come from one more run with a node counter and tracemalloc switched on, so neither
+# slows down the timed runs. Every variant must return the same score for an
+# instance, and timings are compared against a stored baseline.
+#
+#   python benchmarks/benchmark-solvers.py --output benchmarks/baseline.json
+#   python benchmarks/benchmark-solvers.py --baseline benchmarks/baseline.json
+#
+# Baselines only mean something on the machine that recorded them.
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ALPHABET = "ATGCRYKMWBDH"
+
+
+##################### Loading #####################
+
+# The code-dump files have hyphenated names, so they are loaded from their paths
+# (with stdout swallowed, in case a demo prints).
+def load(name, relative_path):
+    if not relative_path.endswith(".py"):
+        sys.path.insert(0, ROOT)
+        return importlib.import_module(relative_path)
+    spec = importlib.util.spec_from_file_location(name, os.path.join(ROOT, relative_path))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    with contextlib.redirect_stdout(io.StringIO()):
+        spec.loader.exec_module(module)
+    return module
+
+# Counts calls of a recursive search method by shadowing it on the instance; the
+# recursion goes through self, so every node passes the wrapper.
+def count_calls(solver, method_name):
+    method = getattr(solver, method_name)
+    counter = [0]
+    def counted(*args):
+        counter[0] += 1
+        return method(*args)
+    setattr(solver, method_name, counted)
+    return counter
+
+
+##################### Variants #####################
+
+def run_engine(module, instance, count):
+    module.cached_cost_table.cache_clear()
+    if instance["booster"]:
+        calculator = module.UtilityWithBooster(instance["target"], instance["weights"], multiplier = instance["multiplier"])
+        solver = module.BoosterAlphaBeta(instance["pool"], calculator, booster_enabled = True)
+        score, _ = solver.run_solver()
+    else:
+        calculator = module.UtilityCalculator(instance["target"], instance["weights"])
+        solver = module.AlphaBetaPruning(instance["pool"], calculator)
+        score, _ = solver.solve()
+    return score, solver.nodes
+
+def run_minimax(module, instance, count):
+    game = module.GeneSequenceGame(instance["pool"], instance["target"], instance["weights"])
+    counter = count_calls(game, "alpha_beta") if count else None
+    score, _ = game.alpha_beta("", instance["pool"], True, float('-inf'), float('inf'))
+    return score, counter and counter[0]
+
+def run_with_utility(module, instance, count):
+    calculator = module.UtilityCalculator(instance["target"], instance["weights"])
+    solver = module.AlphaBetaPruning(instance["pool"], calculator)
+    counter = count_calls(solver, "_alpha_beta") if count else None
+    score, _ = solver.solve()
+    return score, counter and counter[0]
+
+def run_with_booster(module, instance, count):
+    if instance["booster"]:
+        calculator = module.UtilityBoosterCalc(instance["target"], instance["weights"], mul = instance["multiplier"])
+    else:
+        calculator = module.UtilityBoosterCalc(instance["target"], instance["weights"])
+    solver = module.AlphaBetaBooster(instance["pool"], calculator, enable_booster = instance["booster"])
+    counter = count_calls(solver, "_alpha_beta") if count else None
+    score, _ = solver.solve()
+    return score, counter and counter[0]
+
+# name, file, runner, handles booster instances, recursive (capped by --legacy-max-size)
+VARIANTS = [
+    ("engine", "gene_sequence", run_engine, True, False),
+    ("minimax-alpha-beta-pruning", "code-dump/minimax-alpha-beta-pruning.py", run_minimax, False, True),
+    ("alpha-beta-with-utility", "code-dump/alpha-beta-with-utility.py", run_with_utility, False, True),
+    ("alpha-beta-with-utility-and-booster", "code-dump/alpha-beta-with-utility-and-booster.py", run_with_booster, True, True),
+]
+
+
+##################### Instances #####################
+
+# code-dump/alpha-beta-with-utility-and-booster.py also multiplies positions past
+# the end of the weights (weight 1); the other solvers leave those at 1. Booster
+# scores are only cross-checked while the pool fits inside the weights.
+def comparable(name, instance):
+    return not (name == "alpha-beta-with-utility-and-booster" and instance["booster"] and len(instance["pool"]) > len(instance["weights"]))
+
+def config_key(config):
+    return "size=%d dup=%.2f target=%.2f booster=%s" % (config["size"], config["duplicates"], config["target_ratio"], "on" if config["booster"] else "off")
+
+def make_instance(config, seed):
+    rng = random.Random("%s:%s" % (seed, config_key(config)))
+    size = config["size"]
+    distinct = min(len(ALPHABET), max(1, round(size * (1 - config["duplicates"]))))
+    pool = [ALPHABET[i % distinct] for i in range(size)]
+    if config["booster"]:
+        pool[-1] = "S"
+    rng.shuffle(pool)
+    target_length = max(1, round(size * config["target_ratio"]))
+    target = "".join(rng.choice("ATGC") for _ in range(target_length))
+    weights = [rng.randint(1, 9) for _ in range(target_length)]
+    multiplier = round(rng.randint(10, 99) / 100, 2)
+    return {"pool": pool, "target": target, "weights": weights, "booster": config["booster"], "multiplier": multiplier}
+
+def configurations(args):
+    boosters = {"both": (False, True), "on": (True,), "off": (False,)}[args.booster]
+    for size in args.sizes:
+        for duplicates in args.duplicates:
+            for target_ratio in args.target_ratios:
+                for booster in boosters:
+                    yield {"size": size, "duplicates": duplicates, "target_ratio": target_ratio, "booster": booster}
+
+
+##################### Measuring #####################
+
+def measure(runner, module, instance, repeat):
+    seconds = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        score, _ = runner(module, instance, False)
+        seconds = min(seconds, time.perf_counter() - started)
+
+    tracemalloc.start()
+    try:
+        counted_score, nodes = runner(module, instance, True)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    if counted_score != score:
+        raise RuntimeError("score changed between runs")
+    return {
+        "score": score,
+        "seconds": round(seconds, 6),
+        "nodes": nodes,
+        "nodes_per_second": round(nodes / seconds) if nodes and seconds > 0 else None,
+        "peak_bytes": peak,
+    }
+
+def run(args):
+    modules = {}
+    for name, path, runner, handles_booster, recursive in VARIANTS:
+        if name in args.variants:
+            modules[name] = load("bench_" + name.replace("-", "_"), path)
+
+    results = []
+    mismatches = []
+    for config in configurations(args):
+        instance = make_instance(config, args.seed)
+        scores = {}
+        for name, path, runner, handles_booster, recursive in VARIANTS:
+            if name not in modules or (config["booster"] and not handles_booster):
+                continue
+            if recursive and config["size"] > args.legacy_max_size:
+                continue
+            record = measure(runner, modules[name], instance, args.repeat)
+            record.update({"variant": name, "config": config_key(config)})
+            results.append(record)
+            if comparable(name, instance):
+                scores[name] = record["score"]
+            print("%-36s %-44s %10.6fs %10s nodes %12s B" % (name, config_key(config), record["seconds"], record["nodes"], record["peak_bytes"]), file = sys.stderr)
+        if len(set(scores.values())) > 1:
+            mismatches.append({"config": config_key(config), "instance": instance, "scores": scores})
+
+    return {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "seed": args.seed,
+        "repeat": args.repeat,
+        "results": results,
+        "mismatches": mismatches,
+    }
+
+# A run regresses when it is more than `threshold` slower than the baseline; runs
+# under `min_seconds` in both are timer noise and skipped.
+def compare(report, baseline, threshold, min_seconds):
+    previous = {(record["variant"], record["config"]): record for record in baseline["results"]}
+    regressions = []
+    for record in report["results"]:
+        old = previous.get((record["variant"], record["config"]))
+        if old is None or max(old["seconds"], record["seconds"]) < min_seconds:
+            continue
+        if record["seconds"] > old["seconds"] * (1 + threshold):
+            regressions.append({"variant": record["variant"], "config": record["config"], "baseline_seconds": old["seconds"], "seconds": record["seconds"],
+                                "ratio": round(record["seconds"] / old["seconds"], 3) if old["seconds"] > 0 else None})
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description = "Benchmark and cross-check every gene sequence solver in the repo.")
+    parser.add_argument("--sizes", type = int, nargs = "+", default = [4, 6, 8, 10, 12], help = "pool sizes")
+    parser.add_argument("--duplicates", type = float, nargs = "+", default = [0.0, 0.5], help = "share of the pool that repeats a symbol")
+    parser.add_argument("--target-ratios", type = float, nargs = "+", default = [0.5, 1.0, 1.5], help = "target length / pool length")
+    parser.add_argument("--booster", choices = ["both", "on", "off"], default = "both", help = "instances with an S in the pool, without, or both")
+    parser.add_argument("--variants", nargs = "+", default = [variant[0] for variant in VARIANTS], choices = [variant[0] for variant in VARIANTS])
+    parser.add_argument("--legacy-max-size", type = int, default = 10, help = "largest pool for the recursive code-dump solvers")
+    parser.add_argument("--repeat", type = int, default = 3, help = "timed runs per instance (best is kept)")
+    parser.add_argument("--seed", type = int, default = 0)
+    parser.add_argument("--output", metavar = "PATH", help = "write the report as JSON (default stdout)")
+    parser.add_argument("--baseline", metavar = "PATH", help = "baseline report to compare against")
+    parser.add_argument("--threshold", type = float, default = 0.25, help = "allowed slowdown against the baseline (0.25 = 25%%)")
+    parser.add_argument("--min-seconds", type = float, default = 0.01, help = "ignore timings below this in the comparison")
+    args = parser.parse_args()
+
+    report = run(args)
+    if args.baseline is not None:
+        with open(args.baseline) as baseline_file:
+            report["regressions"] = compare(report, json.load(baseline_file), args.threshold, args.min_seconds)
+
+    if args.output is None:
+        json.dump(report, sys.stdout, indent = 2)
+        print()
+    else:
+        with open(args.output, "w") as output_file:
+            json.dump(report, output_file, indent = 2)
+            output_file.write("\n")
+
+    for mismatch in report["mismatches"]:
+        print("MISMATCH %s %s" % (mismatch["config"], mismatch["scores"]), file = sys.stderr)
+    for regression in report.get("regressions", []):
+        print("REGRESSION %s %s %.6fs -> %.6fs" % (regression["variant"], regression["config"], regression["baseline_seconds"], regression["seconds"]), file = sys.stderr)
+    if report["mismatches"] or report.get("regressions"):
+        sys.exit(1)
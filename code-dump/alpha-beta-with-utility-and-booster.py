@@ -129,9 +129,10 @@ class GeneSequenceWithBooster:
             print("Special nucleotide 'S' not found in pool.")
 
 
-nucleotide_pool = ["S", "A", "T", "G", "C"]
-target_sequence = "GCAT"
-student_id_digits = [2, 1, 2, 0, 1, 1, 2, 9]
+if __name__ == "__main__":
+    nucleotide_pool = ["S", "A", "T", "G", "C"]
+    target_sequence = "GCAT"
+    student_id_digits = [2, 1, 2, 0, 1, 1, 2, 9]
 
-game = GeneSequenceWithBooster(nucleotide_pool, target_sequence, student_id_digits)
-game.run()
+    game = GeneSequenceWithBooster(nucleotide_pool, target_sequence, student_id_digits)
+    game.run()
@@ -88,9 +88,10 @@ class GeneSequence:
         print(f"Utility score: {utility_score}")
 
 
-# Sample Input
-pool = ["A", "T", "C", "G"]
-target = "GCAT"
-weights = [8, 8, 1, 1]
-game = GeneSequence(pool, target, weights)
-game.run()
\ No newline at end of file
+if __name__ == "__main__":
+    # Sample Input
+    pool = ["A", "T", "C", "G"]
+    target = "GCAT"
+    weights = [8, 8, 1, 1]
+    game = GeneSequence(pool, target, weights)
+    game.run()
@@ -23,9 +23,10 @@ def calculate_utility(gene_sequence, target_sequence, weights):
     return utility
 
 
-gene = "ATCG"
-target = "ATGC"
-weights = [4, 0, 5, 2]
+if __name__ == "__main__":
+    gene = "ATCG"
+    target = "ATGC"
+    weights = [4, 0, 5, 2]
 
-utility_score = calculate_utility(gene, target, weights)
-print(f"Utility Score: {utility_score}")
\ No newline at end of file
+    utility_score = calculate_utility(gene, target, weights)
+    print(f"Utility Score: {utility_score}")
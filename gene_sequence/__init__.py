@@ -0,0 +1,60 @@
+# Solvers and utility calculators for the gene sequence game. Public names are
+# looked up in their submodules on first access, so importing the package runs
+# nothing but this file. The solver modules also leave multiprocessing and
+# concurrent.futures alone until a parallel solve needs them.
+_EXPORTS = {
+    "TranspositionTable": "transposition",
+    "EXACT": "transposition",
+    "LOWER_BOUND": "transposition",
+    "UPPER_BOUND": "transposition",
+    "MoveOrdering": "ordering",
+    "Alphabet": "packed",
+    "SubstitutionMatrix": "substitution",
+    "substitution_matrix": "substitution",
+    "ORDINAL_DIFFERENCE": "substitution",
+    "TRANSITION_TRANSVERSION": "substitution",
+    "CostTable": "cost_table",
+    "cached_cost_table": "cost_table",
+    "RemainingCostBounds": "bounds",
+    "LeafBatch": "leaf_batch",
+    "SearchStats": "stats",
+    "ResultCache": "result_cache",
+    "SearchEngine": "engine",
+    "ParallelSearch": "parallel",
+    "principal_variations": "variations",
+    "MonteCarloSearch": "monte_carlo",
+    "MonteCarloSolver": "monte_carlo",
+    "candidate_matrix": "batch_scoring",
+    "batch_utility": "batch_scoring",
+    "UtilityCalculator": "without_booster",
+    "AlphaBetaPruning": "without_booster",
+    "GeneSequence": "without_booster",
+    "MultiTargetSearch": "multi_target",
+    "MultiTargetGeneSequence": "multi_target",
+    "UtilityWithBooster": "booster",
+    "BoosterAlphaBeta": "booster",
+    "GeneBoosterRunner": "booster",
+    "solve_job": "batch",
+    "run_batch": "batch",
+    "SolveService": "service",
+    "FastaReader": "fasta",
+    "read_sequence": "fasta",
+    "sliding_windows": "fasta",
+    "solve_windows": "fasta",
+    "main": "cli",
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+    value = getattr(importlib.import_module("." + _EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
@@ -0,0 +1,99 @@
+import json
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from .booster import GeneBoosterRunner
+from .monte_carlo import MonteCarloSolver
+from .without_booster import GeneSequence
+
+##################### Batch Jobs #####################
+
+# One job per JSONL line:
+#   {"id": ..., "pool": ["A", "T", ...] or "AT...", "target": "GCAT", "weights": [2, 3, 1, 8],
+#    "booster": false, "multiplier": 0.23, "matrix": "transition-transversion"}
+# "id" is optional and echoed back. "matrix" is a substitution matrix preset name
+# or a dict of SubstitutionMatrix arguments; the ord scoring by default. A booster job is solved like GeneBoosterRunner:
+# "weights" are the student id digits and "multiplier" defaults to the one derived
+# from them. `cache` is the path of a ResultCache file shared by the workers.
+def solve_job(index, line, cache = None, verify_cache = False):
+    try:
+        job = json.loads(line)
+    except ValueError as error:
+        return {"index": index, "error": f"{type(error).__name__}: {error}", "seconds": 0.0}
+    return solve_record(index, job, cache, verify_cache)
+
+# Solves one parsed job. Errors in the job itself are reported in the result.
+def solve_record(index, job, cache = None, verify_cache = False):
+    started = time.perf_counter()
+    result = {"index": index}
+    try:
+        if "id" in job:
+            result["id"] = job["id"]
+        pool = list(job["pool"])
+        budget = {"time_limit": job.get("time_limit"), "node_limit": job.get("node_limit"), "seed": job.get("seed")}
+        budget["stats"] = bool(job.get("stats"))
+        budget["profile"] = bool(job.get("profile"))
+        budget["matrix"] = job.get("matrix")
+        if cache is not None:
+            from .result_cache import open_cache
+            budget["cache"] = open_cache(cache)
+            budget["verify_cache"] = verify_cache
+        if job.get("booster"):
+            runner = GeneBoosterRunner(pool, job["target"], job["weights"], multiplier = job.get("multiplier"), **budget)
+            result.update(runner.analyse())
+            if runner.cache is not None:
+                result["cached"] = runner.cached
+        else:
+            game = GeneSequence(pool, job["target"], job["weights"], **budget)
+            score, best_sequence = game.solve()
+            if isinstance(game.solver, MonteCarloSolver):
+                result.update(game.solver.summary(score, best_sequence))
+            else:
+                result.update({"best_sequence": best_sequence, "score": score, "nodes": game.solver.nodes})
+                if game.solver.stats is not None:
+                    result["stats"] = game.solver.stats.as_dict()
+                if game.cache is not None:
+                    result["cached"] = game.cached
+    except (KeyError, IndexError, TypeError, ValueError) as error:
+        result["error"] = f"{type(error).__name__}: {error}"
+    result["seconds"] = round(time.perf_counter() - started, 6)
+    return result
+
+# Streams one result record per non-blank input line to `output`.
+def run_batch(lines, output, workers = 1, ordered = True, cache = None, verify_cache = False):
+    jobs = ((index, line, cache, verify_cache) for index, line in enumerate(lines) if line.strip())
+    count = 0
+    for result in stream(solve_job, jobs, workers, ordered):
+        output.write(json.dumps(result) + "\n")
+        output.flush()
+        count += 1
+    return count
+
+# Lazily yields function(*arguments) for each tuple in `calls`, in a process pool
+# when workers > 1. At most `workers * 4` calls are in flight, so memory does not
+# grow with the input.
+def stream(function, calls, workers = 1, ordered = True):
+    if workers == 1:
+        for arguments in calls:
+            yield function(*arguments)
+        return
+
+    max_pending = workers * 4
+    with ProcessPoolExecutor(max_workers = workers) as executor:
+        pending = deque()
+        for arguments in calls:
+            pending.append(executor.submit(function, *arguments))
+            while len(pending) >= max_pending:
+                yield from drain(pending, ordered)
+        while pending:
+            yield from drain(pending, ordered)
+
+def drain(pending, ordered):
+    if ordered:
+        yield pending.popleft().result()
+        return
+    done, _ = wait(pending, return_when = FIRST_COMPLETED)
+    for future in done:
+        pending.remove(future)
+        yield future.result()
@@ -0,0 +1,73 @@
+from .substitution import substitution_matrix
+
+##################### Batch Scoring #####################
+
+# NumPy is only needed for calculate_batch(), leaf batches and multi-target
+# search, so it is imported on first use.
+def _numpy():
+    try:
+        import numpy
+    except ImportError as error:
+        raise ImportError("this feature needs NumPy (pip install numpy)") from error
+    return numpy
+
+# Candidates as a 2-D array of character codes, one row per candidate. Strings
+# shorter than the longest one are padded with 0, which is how calculate() scores a
+# position the gene sequence does not reach.
+def candidate_matrix(candidates, width = 0):
+    np = _numpy()
+    if isinstance(candidates, np.ndarray):
+        if candidates.ndim != 2:
+            raise ValueError("candidate array must be 2-D (candidates x positions)")
+        codes = candidates
+    else:
+        candidates = list(candidates)
+        lengths = set(len(candidate) for candidate in candidates)
+        if len(lengths) == 1:
+            joined = "".join(candidates).encode("latin-1")
+            codes = np.frombuffer(joined, dtype = np.uint8).reshape(len(candidates), lengths.pop())
+        else:
+            codes = np.zeros((len(candidates), max(lengths, default = 0)), dtype = np.uint8)
+            for row in range(len(candidates)):
+                if candidates[row]:
+                    codes[row, :len(candidates[row])] = np.frombuffer(candidates[row].encode("latin-1"), dtype = np.uint8)
+    if codes.shape[1] < width:
+        codes = np.pad(codes, ((0, 0), (0, width - codes.shape[1])))
+    return codes
+
+# Scores every row the way calculate() scores one string: positions are subtracted
+# one column at a time in order, so float sums match the scalar loop bit for bit.
+# Costs come from `matrix` (the ord scoring by default), one 256-entry row per
+# target symbol gathered by the candidates' codes.
+def batch_utility(codes, target_sequence, position_weights, ndigits = None, matrix = None):
+    np = _numpy()
+    matrix = substitution_matrix(matrix)
+    rows = {}
+    for i in range(codes.shape[1]):
+        target_character = ord(target_sequence[i]) if i < len(target_sequence) else 0
+        if target_character not in rows:
+            rows[target_character] = np.array(matrix.row(target_character))
+    integral = all(isinstance(weight, int) for weight in position_weights) and all(row.dtype.kind == "i" for row in rows.values())
+    if integral:
+        total = np.zeros(codes.shape[0], dtype = np.int64)
+    else:
+        total = np.zeros(codes.shape[0], dtype = np.float64)
+
+    for i in range(codes.shape[1]):
+        target_character = ord(target_sequence[i]) if i < len(target_sequence) else 0
+        total -= position_weights[i] * rows[target_character][codes[:, i]]
+
+    if ndigits is None or total.dtype.kind != "f":
+        return total
+    return python_round(total, ndigits)
+
+# numpy.round scales before rounding, so it can disagree with round() when the
+# scaled value lands next to a half; those entries are rounded in Python.
+def python_round(values, ndigits):
+    np = _numpy()
+    rounded = np.round(values, ndigits)
+    scaled = values * 10 ** ndigits
+    near_half = np.abs(scaled - np.floor(scaled) - 0.5) <= 1e-9 * np.maximum(1.0, np.abs(scaled))
+    for index in np.flatnonzero(near_half):
+        rounded[index] = round(float(values[index]), ndigits)
+    return rounded
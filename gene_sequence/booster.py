@@ -0,0 +1,228 @@
+import os
+
+from .batch_scoring import batch_utility, candidate_matrix
+from .cost_table import cached_cost_table
+from .engine import SearchEngine
+from .monte_carlo import MonteCarloSolver
+from .ordering import MoveOrdering
+from .stats import SearchStats
+from .substitution import substitution_matrix
+from .transposition import TranspositionTable
+
+##################### With Booster "S" #####################
+class UtilityWithBooster:
+    def __init__(self, target_sequence, weights, booster_index = None, multiplier = 1.0, matrix = None):
+        self.target_sequence = target_sequence
+        self.weights = weights
+        self.booster_index = booster_index
+        self.multiplier = multiplier
+        self.matrix = substitution_matrix(matrix)
+        self.positions = []
+
+    def weight(self, i):
+        if i < len(self.weights):
+            weight = self.weights[i]
+            if self.booster_index is not None and i >= self.booster_index:
+                weight *= self.multiplier
+            return weight
+        return 1
+
+    # (weight, costs by gene symbol code) per position, compiled on first use.
+    def position_costs(self, length):
+        for i in range(len(self.positions), length):
+            target_char = ord(self.target_sequence[i]) if i < len(self.target_sequence) else 0
+            self.positions.append((self.weight(i), self.matrix.row(target_char)))
+        return self.positions
+
+    def calculate(self, gene_sequence):
+        try:
+            codes = gene_sequence.encode("latin-1")
+        except (AttributeError, UnicodeEncodeError):
+            # Lists of symbols, or symbols past the compiled rows.
+            return self.calculate_symbols(gene_sequence)
+        positions = self.position_costs(max(len(codes), len(self.target_sequence)))
+        total_utility = 0
+        for (weight, costs), code in zip(positions, codes):
+            total_utility -= weight * costs[code]
+        for weight, costs in positions[len(codes):len(self.target_sequence)]:
+            total_utility -= weight * costs[0]
+        return round(total_utility, 2)
+
+    def calculate_symbols(self, gene_sequence):
+        total_utility = 0
+        for i in range(max(len(gene_sequence), len(self.target_sequence))):
+            gene_char = ord(gene_sequence[i]) if i < len(gene_sequence) else 0
+            target_char = ord(self.target_sequence[i]) if i < len(self.target_sequence) else 0
+            total_utility -= self.weight(i) * self.matrix.pair_cost(gene_char, target_char)
+        return round(total_utility, 2)
+
+    def calculate_batch(self, candidates):
+        codes = candidate_matrix(candidates, len(self.target_sequence))
+        weights = [self.weight(i) for i in range(codes.shape[1])]
+        return batch_utility(codes, self.target_sequence, weights, ndigits = 2, matrix = self.matrix)
+
+    def cost_table(self, length, symbols):
+        return cached_cost_table(self.target_sequence, tuple(self.weights), length, tuple(sorted(symbols)), self.multiplier, ndigits = 2, matrix = self.matrix)
+        
+class BoosterAlphaBeta:
+    def __init__(self, pool, utility_object, booster_enabled = False, transposition_table = None, move_ordering = None, workers = 1, split_depth = 1, stats = None, bound_pruning = False,
+                 leaf_batch = 0):
+        self.pool = pool
+        self.utility_object = utility_object
+        self.booster_enabled = booster_enabled
+        if transposition_table is None:
+            transposition_table = TranspositionTable()
+        self.transposition_table = transposition_table
+        if move_ordering is None:
+            move_ordering = MoveOrdering()
+        self.move_ordering = move_ordering
+        self.workers = workers
+        self.split_depth = split_depth
+        self.stats = stats
+        self.bound_pruning = bound_pruning
+        self.leaf_batch = leaf_batch
+        self.cost_table = None
+        self.engine = None
+        self.nodes = 0
+        self.bound_cutoffs = 0
+
+    def prepare(self):
+        if self.cost_table is None:
+            self.cost_table = self.utility_object.cost_table(len(self.pool), set(self.pool))
+            self.engine = SearchEngine(self.pool, self.cost_table, self.booster_enabled, self.transposition_table, self.move_ordering, self.stats, self.bound_pruning,
+                                       self.leaf_batch)
+        return self.engine
+
+    def run_solver(self):  
+        self.prepare()
+        self.move_ordering.reset_counters()
+        if self.workers != 1:
+            from .parallel import ParallelSearch
+            search = ParallelSearch(self.engine, self.workers, self.split_depth)
+        else:
+            search = self.engine
+        if self.stats is not None:
+            result = self.stats.measure(search.search)
+        else:
+            result = search.search()
+        self.nodes = search.nodes
+        self.bound_cutoffs = search.bound_cutoffs
+        return result
+
+    # Lazily yields (score, sequence) from the optimal line down, sharing the search
+    # and its transposition table with run_solver(); see variations.py.
+    def variations(self, max_results = None, floor = None):
+        from .variations import principal_variations
+        return principal_variations(self.prepare(), max_results, floor)
+        
+def _scores(result):
+    with_s = result["with_s"]
+    return result["without_s"]["score"], None if with_s is None else with_s["score"], result["verdict"]
+
+def _run_solver(solver):
+    score, best_sequence = solver.run_solver()
+    return score, best_sequence, solver.nodes, solver.stats
+
+class GeneBoosterRunner:
+    def __init__(self, pool, target, student_id_digits, workers = 1, multiplier = None, time_limit = None, node_limit = None, seed = None, stats = False, profile = False,
+                 cache = None, verify_cache = False, matrix = None):
+        self.pool = pool
+        self.target = target
+        self.workers = workers
+        self.time_limit = time_limit
+        self.node_limit = node_limit
+        self.seed = seed
+        self.stats = stats or profile
+        self.profile = profile
+        self.student_id_digits = student_id_digits
+        self.weights = student_id_digits[-len(target):]
+        self.matrix = substitution_matrix(matrix)
+        if multiplier is None:
+            multiplier = round((student_id_digits[0] * 10 + student_id_digits[1]) / 100, 2)
+        self.boost_multiplier = multiplier
+        # Like GeneSequence, only exact solves without stats use the cache.
+        exact = time_limit is None and node_limit is None and not self.stats
+        self.cache = cache if exact else None
+        self.verify_cache = verify_cache
+        self.cached = False
+
+    def solver(self, pool, utility_object, booster_enabled = False):
+        if self.time_limit is None and self.node_limit is None:
+            search_stats = SearchStats(self.profile) if self.stats else None
+            return BoosterAlphaBeta(pool, utility_object, booster_enabled, workers = self.workers, stats = search_stats)
+        return MonteCarloSolver(pool, utility_object, booster_enabled, self.time_limit, self.node_limit, self.seed)
+
+    def summary(self, solver, score, best_sequence):
+        if isinstance(solver, MonteCarloSolver):
+            return solver.summary(score, best_sequence)
+        summary = {"best_sequence": best_sequence, "score": score, "nodes": solver.nodes}
+        if solver.stats is not None:
+            summary["stats"] = solver.stats.as_dict()
+        return summary
+
+    def analyse(self):
+        if self.cache is None:
+            return self.search()
+        key = self.cache.fingerprint("booster", self.pool, self.target, self.weights, self.boost_multiplier, self.matrix)
+        result, self.cached = self.cache.fetch(key, self.search, _scores, self.verify_cache)
+        if self.cached and not self.verify_cache:
+            # Nothing was searched, which GeneSequence reports as 0 nodes too.
+            result = dict(result)
+            for name in ("without_s", "with_s"):
+                if result[name] is not None:
+                    result[name] = dict(result[name], nodes = 0)
+        return result
+
+    # With more than one worker the with-S search splits over all of them while
+    # the without-S search runs alongside in one more process. The without-S pool
+    # is one symbol shorter and one game simpler, typically a few percent of the
+    # nodes, so it would waste a worker held back for it.
+    def search(self):
+        pool_without_s = [n for n in self.pool if n != "S"]
+        no_booster_calc = UtilityWithBooster(self.target, self.weights, matrix = self.matrix)
+        no_booster_solver = self.solver(pool_without_s, no_booster_calc)
+        if "S" not in self.pool:
+            score_without_s, best_seq_without_s = no_booster_solver.run_solver()
+            return {
+                "without_s": self.summary(no_booster_solver, score_without_s, best_seq_without_s),
+                "with_s": None,
+                "verdict": None,
+            }
+
+        booster_calc = UtilityWithBooster(self.target, self.weights, multiplier=self.boost_multiplier, matrix=self.matrix)
+        booster_solver = self.solver(self.pool, booster_calc, booster_enabled=True)
+        workers = self.workers or os.cpu_count() or 1
+        if isinstance(booster_solver, BoosterAlphaBeta) and workers > 1:
+            no_booster_solver.workers = 1
+            booster_solver.workers = workers
+            from concurrent.futures import ProcessPoolExecutor
+            with ProcessPoolExecutor(max_workers = 1) as executor:
+                pending = executor.submit(_run_solver, no_booster_solver)
+                score_with_s, best_seq_with_s = booster_solver.run_solver()
+                score_without_s, best_seq_without_s, no_booster_solver.nodes, no_booster_solver.stats = pending.result()
+        else:
+            score_without_s, best_seq_without_s = no_booster_solver.run_solver()
+            score_with_s, best_seq_with_s = booster_solver.run_solver()
+
+        return {
+            "without_s": self.summary(no_booster_solver, score_without_s, best_seq_without_s),
+            "with_s": self.summary(booster_solver, score_with_s, best_seq_with_s),
+            "verdict": "YES" if score_with_s > score_without_s else "NO",
+        }
+
+    def execute(self):
+        result = self.analyse()
+        without_s = result["without_s"]
+        print("Without special nucleotide:")
+        print(f"Best gene sequence generated: {without_s['best_sequence']}")
+        print(f"Utility score: {without_s['score']}\n")
+
+        with_s = result["with_s"]
+        if with_s is not None:
+            print(result["verdict"])
+            print("With special nucleotide:")
+            print(f"Best gene sequence generated: {with_s['best_sequence']}")
+            print(f"Utility score: {with_s['score']}\n")
+        else:
+            print("Special nucleotide 'S' not found in pool.")
+        return result
@@ -0,0 +1,57 @@
+##################### Bound Pruning #####################
+
+# Limits on what the positions still to be filled can take off the score. Each
+# position is relaxed on its own: it gets the cheapest (or the dearest) symbol still
+# left in the pool, however many copies remain, so every real completion costs
+# between the two sums and the bounds are admissible.
+#
+# Modes: ROWS while the booster cannot switch on, BOOSTED once it is on, EITHER
+# while the maximizer can still switch it on by placing an "S" (each position then
+# takes the extreme of both rows).
+ROWS = 0
+BOOSTED = 1
+EITHER = 2
+
+class RemainingCostBounds:
+    def __init__(self, cost_table, symbols):
+        self.cost_table = cost_table
+        self.symbols = symbols
+        self.suffixes = {}
+        # Integer costs give exact sums; with floats the bounds are widened by a
+        # relative margin far above any rounding error of the running score.
+        self.slack = 0 if cost_table.int_costs and cost_table.boosted_int_costs else 1e-9
+
+    # Returns (low, high): low[d] and high[d] are the least and the most that
+    # positions d onwards, plus the target tail, can cost given the symbols in
+    # `mask` (bit s set while symbol s has copies left).
+    def limits(self, mask, mode):
+        key = mask * 3 + mode
+        suffix = self.suffixes.get(key)
+        if suffix is None:
+            suffix = self._build(mask, mode)
+            self.suffixes[key] = suffix
+        return suffix
+
+    def _build(self, mask, mode):
+        cost_table = self.cost_table
+        symbols = [self.symbols[s] for s in range(len(self.symbols)) if mask >> s & 1]
+        length = cost_table.length
+        if mode == ROWS:
+            tables = [cost_table.rows]
+            tails = [sum(cost_table.tail)]
+        elif mode == BOOSTED:
+            tables = [cost_table.boosted_rows]
+            tails = [sum(cost_table.boosted_tail)]
+        else:
+            tables = [cost_table.rows, cost_table.boosted_rows]
+            tails = [sum(cost_table.tail), sum(cost_table.boosted_tail)]
+
+        low = [0] * (length + 1)
+        high = [0] * (length + 1)
+        low[length] = min(tails)
+        high[length] = max(tails)
+        for i in range(length - 1, -1, -1):
+            costs = [table[i][symbol] for table in tables for symbol in symbols]
+            low[i] = low[i + 1] + min(costs)
+            high[i] = high[i + 1] + max(costs)
+        return low, high
@@ -0,0 +1,122 @@
+import argparse
+import json
+import os
+import sys
+
+# Sample Input W Booster, solved when no pool is given.
+SAMPLE_POOL = ["S", "A", "T", "G", "C"]
+SAMPLE_TARGET = "GCAT"
+SAMPLE_WEIGHTS = [2, 3, 1, 8, 8, 8, 1, 1]
+
+
+def number(text):
+    try:
+        return int(text)
+    except ValueError:
+        return float(text)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog = "gene-sequence", description = "Minimax gene sequence generator with alpha-beta pruning.")
+    parser.add_argument("--pool", help = "nucleotides to place, e.g. SATGC (default: the sample)")
+    parser.add_argument("--target", help = "target sequence, e.g. GCAT")
+    parser.add_argument("--weights", type = number, nargs = "+", help = "weights, or student id digits with --booster")
+    parser.add_argument("--booster", action = "store_true", help = "compare the best score with and without the special nucleotide S")
+    parser.add_argument("--multiplier", type = float, help = "booster multiplier (default: derived from the first two digits)")
+    parser.add_argument("--matrix", help = "substitution matrix: ord, transition-transversion, or JSON such as "
+                                           "'{\"pairs\": {\"AG\": 1}, \"default\": 2, \"gap\": 4}' (default: ord)")
+    parser.add_argument("--batch", metavar = "JOBS", help = "JSONL file of jobs to solve, '-' for stdin")
+    parser.add_argument("--fasta", metavar = "TARGETS", help = "solve sliding windows over every target in a FASTA file")
+    parser.add_argument("--pool-fasta", metavar = "POOL", help = "read the pool from the first record of a FASTA file")
+    parser.add_argument("--window", type = int, help = "window length for --fasta (default: the pool length)")
+    parser.add_argument("--stride", type = int, help = "distance between window starts (default: the window length)")
+    parser.add_argument("--overlap", type = int, help = "residues shared by neighbouring windows, instead of --stride")
+    parser.add_argument("--output", metavar = "RESULTS", default = "-", help = "where to write JSONL results (default stdout)")
+    parser.add_argument("--workers", type = int, default = 1, help = "worker processes for batch jobs and windows, or to split a single solve")
+    parser.add_argument("--unordered", action = "store_true", help = "write batch results as they complete")
+    # Batch jobs set "time_limit", "node_limit", "seed" and "matrix" per job instead.
+    parser.add_argument("--time-limit", type = float, help = "seconds per solve; switches to Monte Carlo search")
+    parser.add_argument("--node-limit", type = int, help = "Monte Carlo iterations per solve")
+    parser.add_argument("--seed", type = int, help = "random seed for Monte Carlo search")
+    parser.add_argument("--stats", metavar = "PATH", help = "write search stats as JSON")
+    parser.add_argument("--profile", action = "store_true", help = "run the solves under cProfile (with --stats)")
+    parser.add_argument("--cache", metavar = "PATH", default = os.environ.get("GENE_SEQUENCE_CACHE"),
+                        help = "SQLite file of solved instances (default: $GENE_SEQUENCE_CACHE)")
+    parser.add_argument("--no-cache", action = "store_true", help = "solve everything, ignoring --cache")
+    parser.add_argument("--verify-cache", action = "store_true", help = "solve cache hits again and check the cached score")
+    parser.add_argument("--serve", metavar = "ADDRESS", help = "run the JSON-lines solve service on unix:PATH or HOST:PORT")
+    parser.add_argument("--max-pending", type = int, default = 64, help = "searches the service keeps in flight before answering busy")
+    parser.add_argument("--request-timeout", type = float, help = "default seconds the service waits for a search")
+    return parser
+
+
+def main(argv = None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.no_cache:
+        args.cache = None
+    if args.matrix is not None:
+        from .substitution import substitution_matrix
+        try:
+            args.matrix = substitution_matrix(args.matrix)
+        except (TypeError, ValueError) as error:
+            parser.error(f"--matrix: {error}")
+
+    if args.serve is not None:
+        from .service import run_service
+        run_service(args.serve, args.workers, args.max_pending, args.request_timeout, args.cache)
+        return
+
+    if args.batch is not None:
+        from .batch import run_batch
+        jobs = sys.stdin if args.batch == "-" else open(args.batch)
+        results = sys.stdout if args.output == "-" else open(args.output, "w")
+        with jobs, results:
+            run_batch(jobs, results, args.workers, ordered = not args.unordered, cache = args.cache, verify_cache = args.verify_cache)
+        return
+
+    if args.pool_fasta is not None:
+        from .fasta import read_sequence
+        args.pool = read_sequence(args.pool_fasta)
+
+    if args.fasta is not None:
+        from .fasta import solve_windows
+        if args.pool is None or args.weights is None:
+            parser.error("--fasta needs a pool (--pool or --pool-fasta) and --weights")
+        results = sys.stdout if args.output == "-" else open(args.output, "w")
+        with results:
+            windows = solve_windows(args.fasta, args.pool, args.weights, args.window, args.stride, args.overlap, args.booster, args.multiplier,
+                                    args.workers, ordered = not args.unordered, cache = args.cache, verify_cache = args.verify_cache,
+                                    matrix = args.matrix)
+            for result in windows:
+                results.write(json.dumps(result) + "\n")
+                results.flush()
+        return
+
+    if args.pool is None:
+        pool, target, weights, booster = SAMPLE_POOL, SAMPLE_TARGET, SAMPLE_WEIGHTS, True
+    else:
+        if args.target is None or args.weights is None:
+            parser.error("--pool needs --target and --weights")
+        pool, target, weights, booster = list(args.pool), args.target, args.weights, args.booster
+
+    options = {"workers": args.workers, "time_limit": args.time_limit, "node_limit": args.node_limit, "seed": args.seed, "stats": args.stats is not None, "profile": args.profile,
+               "matrix": args.matrix}
+    if args.cache is not None:
+        from .result_cache import ResultCache
+        options["cache"] = ResultCache(args.cache)
+        options["verify_cache"] = args.verify_cache
+    if booster:
+        from .booster import GeneBoosterRunner
+        result = GeneBoosterRunner(pool, target, weights, multiplier = args.multiplier, **options).execute()
+    else:
+        from .without_booster import GeneSequence
+        game = GeneSequence(pool, target, weights, **options)
+        score, best_sequence = game.run()
+        result = {"best_sequence": best_sequence, "score": score, "nodes": game.solver.nodes}
+        if getattr(game.solver, "stats", None) is not None:
+            result["stats"] = game.solver.stats.as_dict()
+
+    if args.stats is not None:
+        with open(args.stats, "w") as stats_file:
+            json.dump(result, stats_file, indent = 2)
@@ -0,0 +1,92 @@
+import functools
+
+from .substitution import ORDINAL_DIFFERENCE
+
+##################### Cost Table #####################
+
+# rows[i][symbol] is the amount placing `symbol` at position i subtracts from the
+# utility, computed with the same operations as the calculators so that a running
+# score built one ply at a time is identical to calling calculate() on the leaf.
+class CostTable:
+    def __init__(self, target_sequence, weights, length, symbols, multiplier = 1.0, ndigits = None, matrix = ORDINAL_DIFFERENCE):
+        self.length = length
+        self.ndigits = ndigits
+        self.rows = []
+        self.boosted_rows = []
+        for i in range(length):
+            target_character = ord(target_sequence[i]) if i < len(target_sequence) else 0
+            row = {}
+            boosted_row = {}
+            for symbol in symbols:
+                difference = matrix.pair_cost(ord(symbol), target_character)
+                if i < len(weights):
+                    row[symbol] = weights[i] * difference
+                    boosted_row[symbol] = weights[i] * multiplier * difference
+                else:
+                    row[symbol] = 1 * difference
+                    boosted_row[symbol] = row[symbol]
+            self.rows.append(row)
+            self.boosted_rows.append(boosted_row)
+
+        # Target positions past the end of the generated sequence are scored against 0.
+        self.tail = []
+        self.boosted_tail = []
+        for i in range(length, len(target_sequence)):
+            gap = matrix.pair_cost(0, ord(target_sequence[i]))
+            if i < len(weights):
+                self.tail.append(weights[i] * gap)
+                self.boosted_tail.append(weights[i] * multiplier * gap)
+            else:
+                self.tail.append(1 * gap)
+                self.boosted_tail.append(self.tail[-1])
+
+        # Sums of int costs are exact, so a line's cost does not depend on the score
+        # it is added to. float64 holds every score when the costs are ints or
+        # floats whose magnitudes add up to less than 2 ** 52.
+        self.int_costs = _all_ints(self.rows, self.tail)
+        self.boosted_int_costs = _all_ints(self.boosted_rows, self.boosted_tail)
+        costs = self.tail + self.boosted_tail
+        for row in self.rows + self.boosted_rows:
+            costs.extend(row.values())
+        self.fits_float64 = all(isinstance(cost, (int, float)) for cost in costs) and sum(abs(cost) for cost in costs) < 2 ** 52
+
+    def finish(self, score, boosted = False):
+        for cost in (self.boosted_tail if boosted else self.tail):
+            score -= cost
+        if self.ndigits is not None:
+            return round(score, self.ndigits)
+        return score
+
+    def extend(self, score, position, line, booster_index = None):
+        for symbol in line:
+            if booster_index is not None and position >= booster_index:
+                score -= self.boosted_rows[position][symbol]
+            else:
+                score -= self.rows[position][symbol]
+            position += 1
+        return score
+
+    def prefix(self, sequence, booster_index = None):
+        return self.extend(0, 0, sequence, booster_index)
+
+    def score(self, sequence, booster_index = None):
+        return self.finish(self.prefix(sequence, booster_index), booster_index is not None)
+
+def _all_ints(rows, tail):
+    return all(isinstance(cost, int) for cost in tail) and all(isinstance(cost, int) for row in rows for cost in row.values())
+
+
+# Tables are read-only once built, so solvers (and batch jobs in the same worker
+# process) that share a target, weights, multiplier and matrix share one table.
+# 1 and 1.0 are equal keys but score as an int and a float, so weights and the
+# multiplier are keyed with their types.
+def cached_cost_table(target_sequence, weights, length, symbols, multiplier = 1.0, ndigits = None, matrix = ORDINAL_DIFFERENCE):
+    typed_weights = tuple((type(weight), weight) for weight in weights)
+    return _cached_cost_table(target_sequence, typed_weights, length, symbols, (type(multiplier), multiplier), ndigits, matrix)
+
+@functools.lru_cache(maxsize = 256)
+def _cached_cost_table(target_sequence, typed_weights, length, symbols, typed_multiplier, ndigits, matrix):
+    return CostTable(target_sequence, [weight for _, weight in typed_weights], length, symbols, typed_multiplier[1], ndigits, matrix)
+
+cached_cost_table.cache_clear = _cached_cost_table.cache_clear
+cached_cost_table.cache_info = _cached_cost_table.cache_info
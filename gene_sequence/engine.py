@@ -0,0 +1,484 @@
+import math
+import time
+
+from .bounds import BOOSTED, EITHER, ROWS, RemainingCostBounds
+from .ordering import MoveOrdering
+from .packed import Alphabet
+from .transposition import EXACT, UPPER_BOUND, TranspositionTable, bound_flag, usable_entry
+
+##################### Search Engine #####################
+
+# Iterative alpha-beta shared by AlphaBetaPruning and BoosterAlphaBeta. Frames are
+# kept in per-depth lists instead of Python frames and moves in one preallocated
+# buffer. A sequence is only copied out of the buffer when it becomes the best line
+# of a node.
+#
+# The pool is held as a multiset: a node branches once per distinct symbol left,
+# always taking that symbol's next occurrence in the pool, and the remaining pool is
+# the mixed-radix number of occurrences taken of each symbol. Taking a later copy of
+# the same symbol leads to an identical subtree that pool order would never prefer,
+# so the best line and score are unchanged.
+#
+# Booster state per depth: 0 while no "S" has been placed, 1 once the maximizer has
+# switched the booster on, and 2 + p when the minimizer placed the first "S" at p
+# (a later maximizer "S" then boosts from p onwards).
+#
+# Table entries hold a line, as a str or packed into an int (see packed.Alphabet),
+# or with bound pruning a float offset from the node's score when it has no line.
+# A line found below one prefix is only reused below another when the subtree's
+# costs are ints: every completion then shifts by the same exact amount. Float
+# sums and rounding can make lines that tied under one prefix score differ under
+# another, so those entries are also keyed by the node's score. After a minimizer
+# "S" a trigger re-scores the prefix from it (alt), which is keyed as well.
+#
+# With leaf_batch = k a node with at most k symbols left is not searched move by
+# move: LeafBatch scores all its completions as one NumPy array and resolves the
+# remaining plies with reductions (see leaf_batch.py).
+ENTER = 0
+RETURN = 1
+ADVANCE = 2
+SHARED_BOUND_POLL = 1024
+
+class SearchEngine:
+    def __init__(self, pool, cost_table, booster_enabled = False, transposition_table = None, move_ordering = None, stats = None, bound_pruning = False,
+                 leaf_batch = 0):
+        self.pool = list(pool)
+        self.cost_table = cost_table
+        self.booster_enabled = booster_enabled
+        self.stats = stats
+        if transposition_table is None:
+            transposition_table = TranspositionTable()
+        self.transposition_table = transposition_table
+        if move_ordering is None:
+            move_ordering = MoveOrdering()
+        self.move_ordering = move_ordering
+        self.nodes = 0
+
+        self.symbols = []
+        self.occurrences = []
+        self.symbol_ids = []
+        ids = {}
+        for i in range(len(self.pool)):
+            nucleotide = self.pool[i]
+            if nucleotide not in ids:
+                ids[nucleotide] = len(self.symbols)
+                self.symbols.append(nucleotide)
+                self.occurrences.append([])
+            self.occurrences[ids[nucleotide]].append(i)
+            self.symbol_ids.append(ids[nucleotide])
+        # Packs lines for a transposition table created with packed = True.
+        self.alphabet = None
+        self.radix = []
+        self.state_stride = 1
+        for occurrence in self.occurrences:
+            self.radix.append(self.state_stride)
+            self.state_stride *= len(occurrence) + 1
+
+        self.booster_symbol = self.symbols.index("S") if booster_enabled and "S" in self.symbols else None
+        self.bounds = RemainingCostBounds(cost_table, self.symbols) if bound_pruning else None
+        self.bound_cutoffs = 0
+
+        self.leaf_batch = leaf_batch
+        self.leaves = None
+        # Costs float64 cannot hold exactly are left to the recursive search.
+        if leaf_batch > 1 and cost_table.fits_float64:
+            from .leaf_batch import LeafBatch
+            self.leaves = LeafBatch(cost_table, self.symbols, self.symbol_ids, self.booster_symbol)
+
+    # Searches the node reached by playing `prefix` (pool indices, each the next
+    # occurrence of its symbol) with the window (alpha, beta). `shared_bound` is a
+    # multiprocessing.Value holding a score the root is already known to reach;
+    # it is polled while searching and raises alpha on every open frame.
+    def search(self, prefix = (), alpha = float('-inf'), beta = float('inf'), shared_bound = None):
+        pool = self.pool
+        n = len(pool)
+        cost_table = self.cost_table
+        self.exact = True
+        stats = self.stats
+        if stats is not None:
+            stats.reserve(n)
+            perf_counter = time.perf_counter
+        if n == 0:
+            self.nodes = 1
+            return cost_table.finish(0), ""
+
+        rows = cost_table.rows
+        boosted_rows = cost_table.boosted_rows
+        finish = cost_table.finish
+        ndigits = cost_table.ndigits
+        has_tail = bool(cost_table.tail)
+        nextafter = math.nextafter
+        table = self.transposition_table
+        encode = None
+        if table.packed:
+            if self.alphabet is None:
+                self.alphabet = Alphabet(self.symbols)
+            encode = self.alphabet.encode
+            decode = self.alphabet.decode
+        ordering = self.move_ordering
+        booster_enabled = self.booster_enabled
+        negative_infinity = float('-inf')
+        positive_infinity = float('inf')
+        occurrences = self.occurrences
+        symbol_ids = self.symbol_ids
+        radix = self.radix
+        state_stride = self.state_stride
+        counts = [len(occurrence) for occurrence in occurrences]
+        symbol_range = range(len(occurrences))
+        booster_symbol = self.booster_symbol
+        rows_exact = cost_table.int_costs
+        boosted_exact = cost_table.boosted_int_costs
+        bounds = self.bounds
+        if bounds is not None:
+            bound_slack = bounds.slack
+        else:
+            bound_slack = 1e-9
+        # Rounding each leaf moves a shifted bound by up to one unit in the last digit.
+        rounding_slack = 10.0 ** -ndigits if ndigits is not None and bound_slack else 0
+        bound_cutoffs = 0
+        leaves = self.leaves
+        leaf_batch = self.leaf_batch if leaves is not None else 0
+
+        buffer = [None] * n
+        taken = [0] * len(occurrences)
+        chosen = [0] * n
+        score = [0] * (n + 1)
+        code = [0] * (n + 1)
+        state = [0] * (n + 1)
+        alt = [0] * (n + 1)
+        window_alpha = alpha
+        window_beta = beta
+        alpha = [alpha] * (n + 1)
+        beta = [beta] * (n + 1)
+        alpha_original = [0] * n
+        beta_original = [0] * n
+        best = [0] * n
+        best_index = [0] * n
+        best_line = [None] * n
+        moves = [None] * n
+        cursor = [0] * n
+        keys = [None] * n
+
+        start_depth = len(prefix)
+        for depth in range(start_depth):
+            i = prefix[depth]
+            buffer[depth] = pool[i]
+            symbol_id = symbol_ids[i]
+            chosen[depth] = symbol_id
+            taken[symbol_id] += 1
+            code[depth + 1] = code[depth] + radix[symbol_id]
+            score[depth + 1], state[depth + 1] = self._play(buffer, depth, score[depth], state[depth])
+            if state[depth + 1] >= 2:
+                alt[depth + 1] = cost_table.prefix(buffer[:depth + 1], state[depth + 1] - 2)
+
+        nodes = 0
+        next_poll = SHARED_BOUND_POLL
+        depth = start_depth
+        if depth == n:
+            nodes = 1
+            if stats is not None:
+                stats.leaf(n, 0.0)
+            value = finish(score[n], state[n] == 1)
+            self.nodes = nodes
+            self.exact = window_alpha < value < window_beta
+            return value, "".join(buffer)
+        phase = ENTER
+        # What a finished node hands to its parent: the score, and the line as a
+        # stored string taking over from position `start` (None means the buffer).
+        value = 0
+        line = None
+        start = 0
+
+        while True:
+            if phase == ENTER:
+                nodes += 1
+                if stats is not None:
+                    stats.enter(depth)
+                if shared_bound is not None and nodes >= next_poll:
+                    next_poll = nodes + SHARED_BOUND_POLL
+                    bound = nextafter(shared_bound.value, negative_infinity)
+                    if bound > window_alpha:
+                        window_alpha = bound
+                        for frame in range(start_depth, depth + 1):
+                            if alpha[frame] < bound:
+                                alpha[frame] = bound
+                            if frame < depth and alpha_original[frame] < bound:
+                                alpha_original[frame] = bound
+                phase = ADVANCE
+                key = None
+                # Nodes with a single move left are cheaper to search than to look up.
+                if n - depth > 1:
+                    current_state = state[depth]
+                    key = code[depth] + state_stride * current_state
+                    if current_state == 1:
+                        exact_costs = boosted_exact
+                    elif booster_symbol is not None and taken[booster_symbol] < counts[booster_symbol]:
+                        exact_costs = rows_exact and boosted_exact
+                        if current_state >= 2:
+                            # With int costs only the gap between the two scores matters.
+                            key = (key, score[depth] - alt[depth]) if exact_costs else (key, score[depth], alt[depth])
+                            exact_costs = True
+                    else:
+                        exact_costs = rows_exact
+                    if not exact_costs:
+                        key = (key, score[depth])
+                    entry = table.probe(key)
+                    if entry is not None:
+                        flag, stored = entry
+                        if stats is not None:
+                            scoring_started = perf_counter()
+                        if stored.__class__ is not float:
+                            if stored.__class__ is int:
+                                stored = decode(stored, n)
+                            value = self._line_value(buffer, depth, score[depth], state[depth], stored)
+                        else:
+                            # A bound kept relative to the score it was found at.
+                            value = score[depth] + stored
+                            margin = bound_slack * (abs(score[depth]) + abs(stored) + 1) + rounding_slack if bound_slack else 0
+                            value = value + margin if flag == UPPER_BOUND else value - margin
+                            stored = None
+                        if stats is not None:
+                            stats.transposition_hit(depth, perf_counter() - scoring_started)
+                        if usable_entry(flag, value, alpha[depth], beta[depth]):
+                            line = stored
+                            start = depth if stored is not None else 0
+                            phase = RETURN
+                            if stats is not None:
+                                stats.leave(depth)
+                # A node whose best possible completion cannot reach alpha, or whose
+                # worst cannot fall below beta, returns that bound with no line. The
+                # value lies outside the window, so it is never exact.
+                if bounds is not None and phase == ADVANCE and n - depth > 2:
+                    current_state = state[depth]
+                    if current_state == 1:
+                        mode = BOOSTED
+                    elif booster_symbol is not None and taken[booster_symbol] < counts[booster_symbol]:
+                        # After a minimizer "S" a trigger re-scores placed positions.
+                        mode = EITHER if current_state == 0 else None
+                    else:
+                        mode = ROWS
+                    if mode is not None:
+                        mask = 0
+                        for s in symbol_range:
+                            if taken[s] < counts[s]:
+                                mask |= 1 << s
+                        low, high = bounds.limits(mask, mode)
+                        current_score = score[depth]
+                        upper = current_score - low[depth]
+                        lower = current_score - high[depth]
+                        if bound_slack:
+                            margin = bound_slack * (abs(current_score) + abs(low[depth]) + abs(high[depth]) + 1)
+                            upper += margin
+                            lower -= margin
+                        if ndigits is not None:
+                            upper = round(upper, ndigits)
+                            lower = round(lower, ndigits)
+                        if upper <= alpha[depth] or lower >= beta[depth]:
+                            value = upper if upper <= alpha[depth] else lower
+                            line = None
+                            start = 0
+                            phase = RETURN
+                            bound_cutoffs += 1
+                            if stats is not None:
+                                stats.bound_cutoff(depth)
+                                stats.leave(depth)
+                if phase == ADVANCE and n - depth <= leaf_batch:
+                    if stats is not None:
+                        scoring_started = perf_counter()
+                    current_state = state[depth]
+                    rescored = cost_table.prefix(buffer[:depth], current_state - 2) if current_state >= 2 else None
+                    remaining = [i for s in symbol_range for i in occurrences[s][taken[s]:]]
+                    remaining.sort()
+                    completion = leaves.resolve(depth, remaining, score[depth], current_state, rescored)
+                    for offset in range(len(completion)):
+                        buffer[depth + offset] = pool[completion[offset]]
+                    line = "".join(buffer)
+                    value = self._line_value(buffer, depth, score[depth], current_state, line)
+                    if key is not None:
+                        table.store(key, EXACT, line if encode is None else encode(line))
+                    start = 0
+                    phase = RETURN
+                    if stats is not None:
+                        stats.leaf_batch(depth, perf_counter() - scoring_started)
+                        stats.leave(depth)
+                if phase == ADVANCE:
+                    keys[depth] = key
+                    alpha_original[depth] = alpha[depth]
+                    beta_original[depth] = beta[depth]
+                    candidates = [occurrences[s][taken[s]] for s in symbol_range if taken[s] < counts[s]]
+                    if len(candidates) == 1:
+                        moves[depth] = candidates
+                    else:
+                        candidates.sort()
+                        row = boosted_rows[depth] if state[depth] == 1 else rows[depth]
+                        moves[depth] = ordering.order(pool, candidates, row, depth, not depth & 1)
+                    cursor[depth] = 0
+                    best[depth] = positive_infinity if depth & 1 else negative_infinity
+                    best_index[depth] = n
+                    best_line[depth] = None
+
+            elif phase == RETURN:
+                if depth == start_depth:
+                    break
+                depth -= 1
+                phase = ADVANCE
+                taken[chosen[depth]] -= 1
+                move_number = cursor[depth] - 1
+                i = moves[depth][move_number]
+                current_best = best[depth]
+                if depth & 1:
+                    improved = value < current_best
+                else:
+                    improved = value > current_best
+                if improved or (value == current_best and i < best_index[depth]):
+                    best[depth] = value
+                    best_index[depth] = i
+                    if start == 0:
+                        best_line[depth] = line
+                    elif line is None:
+                        best_line[depth] = "".join(buffer[:start])
+                    else:
+                        best_line[depth] = "".join(buffer[:start]) + line[start:]
+                    if depth & 1:
+                        if value < beta[depth]:
+                            beta[depth] = value
+                    elif value > alpha[depth]:
+                        alpha[depth] = value
+                if alpha[depth] >= beta[depth]:
+                    ordering.record_cutoff(depth, pool[i], n - depth, move_number)
+                    if stats is not None:
+                        stats.cutoff(depth, move_number)
+                    cursor[depth] = len(moves[depth])
+
+            if phase == ADVANCE:
+                if cursor[depth] == len(moves[depth]):
+                    if keys[depth] is not None:
+                        flag = bound_flag(best[depth], alpha_original[depth], beta_original[depth])
+                        if best_line[depth] is not None:
+                            table.store(keys[depth], flag, best_line[depth] if encode is None else encode(best_line[depth]))
+                        elif state[depth] < 2:
+                            # A bound without a line is stored as a float offset from
+                            # this node's score. Once a minimizer "S" is placed, a trigger
+                            # re-scores the prefix, so the offset would not carry over.
+                            table.store(keys[depth], flag, float(best[depth] - score[depth]))
+                    value = best[depth]
+                    line = best_line[depth]
+                    start = 0
+                    phase = RETURN
+                    if stats is not None:
+                        stats.leave(depth)
+                    continue
+
+                i = moves[depth][cursor[depth]]
+                cursor[depth] += 1
+                symbol = pool[i]
+                buffer[depth] = symbol
+                symbol_id = symbol_ids[i]
+                chosen[depth] = symbol_id
+                taken[symbol_id] += 1
+                child = depth + 1
+                code[child] = code[depth] + radix[symbol_id]
+                current_state = state[depth]
+                if current_state == 1:
+                    score[child] = score[depth] - boosted_rows[depth][symbol]
+                    state[child] = 1
+                elif booster_enabled and symbol == "S":
+                    if not depth & 1:
+                        if current_state == 0:
+                            score[child] = score[depth] - boosted_rows[depth][symbol]
+                        else:
+                            score[child] = alt[depth] - boosted_rows[depth][symbol]
+                        state[child] = 1
+                    else:
+                        score[child] = score[depth] - rows[depth][symbol]
+                        if current_state == 0:
+                            state[child] = 2 + depth
+                            alt[child] = score[depth] - boosted_rows[depth][symbol]
+                        else:
+                            state[child] = current_state
+                            alt[child] = alt[depth] - boosted_rows[depth][symbol]
+                else:
+                    score[child] = score[depth] - rows[depth][symbol]
+                    state[child] = current_state
+                    if current_state >= 2:
+                        alt[child] = alt[depth] - boosted_rows[depth][symbol]
+
+                # A move earlier in the pool than the current best is searched with
+                # the bound widened by one ulp, so an equal score comes back exact
+                # and the earlier move wins the tie as it would in pool order.
+                alpha[child] = alpha[depth]
+                beta[child] = beta[depth]
+                if i < best_index[depth]:
+                    if depth & 1:
+                        if beta[depth] == best[depth]:
+                            beta[child] = nextafter(beta[depth], positive_infinity)
+                    elif alpha[depth] == best[depth]:
+                        alpha[child] = nextafter(alpha[depth], negative_infinity)
+                depth = child
+                if child == n:
+                    nodes += 1
+                    if stats is not None:
+                        scoring_started = perf_counter()
+                    if has_tail:
+                        value = finish(score[n], state[n] == 1)
+                    elif ndigits is None:
+                        value = score[n]
+                    else:
+                        value = round(score[n], ndigits)
+                    if stats is not None:
+                        stats.leaf(n, perf_counter() - scoring_started)
+                    line = None
+                    start = n
+                    phase = RETURN
+                else:
+                    phase = ENTER
+
+        self.nodes = nodes
+        self.bound_cutoffs = bound_cutoffs
+        self.exact = window_alpha < value < window_beta
+        if start_depth == 0 or start == 0:
+            return value, line
+        return value, "".join(buffer[:start]) + line[start:]
+
+    # The same step the inner loop of search() inlines, used to replay a prefix.
+    def _play(self, buffer, depth, score, state):
+        symbol = buffer[depth]
+        if state == 1:
+            return score - self.cost_table.boosted_rows[depth][symbol], 1
+        if self.booster_enabled and symbol == "S":
+            if depth % 2 == 0:
+                if state == 0:
+                    return score - self.cost_table.boosted_rows[depth][symbol], 1
+                return self.cost_table.prefix(buffer[:depth + 1], state - 2), 1
+            return score - self.cost_table.rows[depth][symbol], 2 + depth if state == 0 else state
+        return score - self.cost_table.rows[depth][symbol], state
+
+    def candidates(self, prefix = ()):
+        taken = [0] * len(self.occurrences)
+        for i in prefix:
+            taken[self.symbol_ids[i]] += 1
+        moves = []
+        for s in range(len(self.occurrences)):
+            if taken[s] < len(self.occurrences[s]):
+                moves.append(self.occurrences[s][taken[s]])
+        moves.sort()
+        return moves
+
+    def _line_value(self, buffer, depth, score, state, line):
+        cost_table = self.cost_table
+        suffix = line[depth:]
+        if not self.booster_enabled:
+            return cost_table.finish(cost_table.extend(score, depth, suffix))
+        if state == 1:
+            return cost_table.finish(cost_table.extend(score, depth, suffix, depth), True)
+
+        triggered = False
+        for offset in range(len(suffix)):
+            if suffix[offset] == "S" and (depth + offset) % 2 == 0:
+                triggered = True
+                break
+        if not triggered:
+            return cost_table.finish(cost_table.extend(score, depth, suffix))
+        if state == 0:
+            return cost_table.finish(cost_table.extend(score, depth, suffix, depth + suffix.index("S")), True)
+        return cost_table.score("".join(buffer[:depth]) + suffix, state - 2)
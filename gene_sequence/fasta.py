@@ -0,0 +1,155 @@
+from .batch import solve_record, stream
+
+##################### FASTA Input #####################
+
+HEADER = 0
+RESIDUES = 1
+WHITESPACE = b" \t\r\n"
+
+# Reads a FASTA file in fixed-size chunks, so memory stays at one chunk however
+# long the records are. records() yields (name, chunks) per record, where chunks
+# is an iterator of upper-case residue strings. Like itertools.groupby, a record's
+# chunks are only valid until the next record is requested; whatever was not read
+# is skipped.
+class FastaReader:
+    def __init__(self, path, chunk_size = 1 << 20):
+        self.path = path
+        self.chunk_size = chunk_size
+        self.name = None
+
+    def records(self):
+        events = self._events()
+        first = next(events, None)
+        if first is None:
+            return
+        if first[0] == HEADER:
+            self.name = first[1]
+        else:
+            # Residues before the first header belong to an unnamed record.
+            self.name = ""
+            events = _chain_first(first, events)
+        while self.name is not None:
+            name = self.name
+            self.name = None
+            chunks = self._chunks(events)
+            yield name, chunks
+            for _ in chunks:
+                pass
+
+    def _chunks(self, events):
+        for kind, value in events:
+            if kind == HEADER:
+                self.name = value
+                return
+            yield value
+
+    def _events(self):
+        with open(self.path, "rb") as handle:
+            line_start = True
+            header = None
+            while True:
+                chunk = handle.read(self.chunk_size)
+                if not chunk:
+                    break
+                position = 0
+                while position < len(chunk):
+                    if header is not None:
+                        end = chunk.find(b"\n", position)
+                        if end < 0:
+                            header.append(chunk[position:])
+                            break
+                        header.append(chunk[position:end])
+                        yield HEADER, b"".join(header).decode("ascii", "replace").strip()
+                        header = None
+                        position = end + 1
+                        line_start = True
+                    elif line_start and chunk[position:position + 1] == b">":
+                        header = []
+                        position += 1
+                    else:
+                        end = chunk.find(b"\n>", position)
+                        if end < 0:
+                            piece = chunk[position:]
+                            position = len(chunk)
+                            line_start = piece.endswith(b"\n")
+                        else:
+                            piece = chunk[position:end + 1]
+                            position = end + 1
+                            line_start = True
+                        residues = piece.translate(None, WHITESPACE)
+                        if residues:
+                            yield RESIDUES, residues.upper().decode("ascii")
+            if header is not None:
+                yield HEADER, b"".join(header).decode("ascii", "replace").strip()
+
+def _chain_first(first, rest):
+    yield first
+    yield from rest
+
+# Reads one small record whole, e.g. a pool of nucleotides. `name` picks a record
+# by header; the first record is used otherwise.
+def read_sequence(path, name = None):
+    for record_name, chunks in FastaReader(path).records():
+        if name is None or record_name == name or record_name.split()[0] == name:
+            return "".join(chunks)
+    raise ValueError(f"no FASTA record {name!r} in {path}")
+
+
+##################### Sliding Windows #####################
+
+# Yields (start, window) over a stream of residue chunks. Windows are `window`
+# residues long and start every `stride` residues (stride < window overlaps them,
+# stride > window leaves gaps). With `partial`, a shorter last window covers
+# residues the full windows did not reach. Only window + one chunk of residues is
+# held at a time.
+def sliding_windows(chunks, window, stride = None, partial = True):
+    if stride is None:
+        stride = window
+    if window <= 0 or stride <= 0:
+        raise ValueError("window and stride must be positive")
+    buffer = ""
+    buffer_start = 0
+    next_start = 0
+    covered = 0
+    for chunk in chunks:
+        buffer += chunk
+        while next_start + window <= buffer_start + len(buffer):
+            offset = next_start - buffer_start
+            yield next_start, buffer[offset:offset + window]
+            covered = next_start + window
+            next_start += stride
+        drop = min(next_start - buffer_start, len(buffer))
+        if drop > 0:
+            buffer = buffer[drop:]
+            buffer_start += drop
+    end = buffer_start + len(buffer)
+    if partial and next_start < end and covered < end:
+        yield next_start, buffer[next_start - buffer_start:]
+
+# One job per window of every record in `target_path`, shaped like a batch job.
+# The id carries (record, start, end) back through the worker pool.
+def window_jobs(target_path, pool, weights, window, stride = None, booster = False, multiplier = None, chunk_size = 1 << 20, partial = True, matrix = None):
+    for name, chunks in FastaReader(target_path, chunk_size).records():
+        for start, target in sliding_windows(chunks, window, stride, partial):
+            yield {"id": (name, start, start + len(target)), "pool": pool, "target": target, "weights": weights,
+                   "booster": booster, "multiplier": multiplier, "matrix": matrix}
+
+# Solves every window of the targets in a FASTA file against `pool` with the same
+# rules as a batch job, yielding results as they are ready. `window` defaults to
+# the pool length; give either `stride` or `overlap` (stride = window - overlap).
+# `cache` is the path of a ResultCache file, as for run_batch(), and `matrix` a
+# substitution matrix as for a batch job.
+def solve_windows(target_path, pool, weights, window = None, stride = None, overlap = None, booster = False, multiplier = None,
+                  workers = 1, ordered = True, chunk_size = 1 << 20, partial = True, cache = None, verify_cache = False, matrix = None):
+    pool = list(pool)
+    if window is None:
+        window = len(pool)
+    if stride is None:
+        stride = window - (overlap or 0)
+    if stride <= 0:
+        raise ValueError("overlap must be smaller than the window")
+    jobs = window_jobs(target_path, pool, weights, window, stride, booster, multiplier, chunk_size, partial, matrix)
+    calls = ((index, job, cache, verify_cache) for index, job in enumerate(jobs))
+    for result in stream(solve_record, calls, workers, ordered):
+        result["record"], result["start"], result["end"] = result.pop("id")
+        yield result
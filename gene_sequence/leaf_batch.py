@@ -0,0 +1,110 @@
+import itertools
+
+from .batch_scoring import _numpy, python_round
+
+##################### Leaf Batches #####################
+
+# Resolves the last plies of a search in one go: every ordering of the pool
+# indices left is a row of an array, scored with the cost table's entries and
+# folded back up the plies with max/min over the last axis. Each row subtracts
+# its costs one position at a time, in the same order as the engine's running
+# score, so leaf values and their ties match the recursive search exactly. On a
+# tie the first index wins, which is the earliest pool index, as in pool order.
+#
+# All k! orderings are scored, duplicates included, so the shape stays
+# (k, k - 1, ..., 1) and each ply is one reduction. Scores are float64, so the
+# cost table must have fits_float64 set.
+class LeafBatch:
+    def __init__(self, cost_table, symbols, symbol_ids, booster_symbol = None):
+        np = _numpy()
+        self.ndigits = cost_table.ndigits
+        self.booster_symbol = booster_symbol
+        self.symbol_ids = np.array(symbol_ids, dtype = np.intp)
+        self.rows = np.array([[row[symbol] for symbol in symbols] for row in cost_table.rows], dtype = np.float64).reshape(cost_table.length, len(symbols))
+        self.boosted_rows = np.array([[row[symbol] for symbol in symbols] for row in cost_table.boosted_rows], dtype = np.float64).reshape(cost_table.length, len(symbols))
+        self.tail = np.array(cost_table.tail, dtype = np.float64)
+        self.boosted_tail = np.array(cost_table.boosted_tail, dtype = np.float64)
+        self.orders = {}
+
+    def permutations(self, k):
+        order = self.orders.get(k)
+        if order is None:
+            np = _numpy()
+            order = np.array(list(itertools.permutations(range(k))), dtype = np.intp).reshape(-1, k)
+            self.orders[k] = order
+        return order
+
+    # The best ordering of `remaining` (ascending pool indices) from `depth` on, for
+    # a node with running score `score` and booster `state`. `rescored` is the
+    # prefix scored with the booster on from the minimizer's "S" (state >= 2).
+    def resolve(self, depth, remaining, score, state, rescored = None):
+        np = _numpy()
+        k = len(remaining)
+        order = self.permutations(k)
+        symbols = self.symbol_ids[np.array(remaining, dtype = np.intp)][order]
+        booster = self.booster_symbol
+        if state == 1 or booster is None or booster not in symbols[0]:
+            values = self.constant_state(depth, symbols, score, state == 1)
+        else:
+            values = self.booster_states(depth, symbols, score, state, rescored)
+        if self.ndigits is not None:
+            values = python_round(values, self.ndigits)
+
+        # folded[j] is the value of every node j plies below this one.
+        folded = [None] * k
+        values = values.reshape(tuple(range(k, 0, -1)))
+        folded[k - 1] = values
+        for j in range(k - 1, 0, -1):
+            values = values.min(axis = -1) if (depth + j) & 1 else values.max(axis = -1)
+            folded[j - 1] = values
+        choice = ()
+        for j in range(k):
+            children = folded[j][choice]
+            choice += (int(children.argmin() if (depth + j) & 1 else children.argmax()),)
+        row = order[np.ravel_multi_index(choice, tuple(range(k, 0, -1)))]
+        return [remaining[i] for i in row]
+
+    # No "S" can change the booster state below this node.
+    def constant_state(self, depth, symbols, score, boosted):
+        np = _numpy()
+        k = symbols.shape[1]
+        rows = self.boosted_rows if boosted else self.rows
+        tail = self.boosted_tail if boosted else self.tail
+        terms = np.empty((symbols.shape[0], 1 + k + len(tail)), dtype = np.float64)
+        terms[:, 0] = score
+        terms[:, 1:k + 1] = rows[np.arange(depth, depth + k), symbols]
+        terms[:, k + 1:] = tail
+        return np.subtract.reduce(terms, axis = 1)
+
+    # Steps every row through the booster states the way the engine does; `alt` is
+    # the score with the booster on from the minimizer's "S", which a later
+    # maximizer "S" switches to.
+    def booster_states(self, depth, symbols, score, state, rescored):
+        np = _numpy()
+        count, k = symbols.shape
+        current = np.full(count, score, dtype = np.float64)
+        states = np.full(count, state, dtype = np.intp)
+        alt = np.full(count, rescored if state >= 2 else 0, dtype = np.float64)
+        for j in range(k):
+            position = depth + j
+            column = symbols[:, j]
+            plain = current - self.rows[position][column]
+            boosted = current - self.boosted_rows[position][column]
+            alt_boosted = alt - self.boosted_rows[position][column]
+            placed = column == self.booster_symbol
+            on = states == 1
+            if position & 1:
+                started = placed & (states == 0)
+                alt = np.where(started, boosted, alt_boosted)
+                current = np.where(on, boosted, plain)
+                states = np.where(started, 2 + position, states)
+            else:
+                triggered = placed & ~on
+                current = np.where(on | (triggered & (states == 0)), boosted, plain)
+                current = np.where(triggered & (states >= 2), alt_boosted, current)
+                alt = alt_boosted
+                states = np.where(triggered, 1, states)
+        on = states == 1
+        for i in range(len(self.tail)):
+            current = current - np.where(on, self.boosted_tail[i], self.tail[i])
+        return current
@@ -0,0 +1,198 @@
+import math
+import random
+import time
+
+from .engine import SearchEngine
+from .ordering import MoveOrdering
+from .transposition import TranspositionTable
+
+##################### Monte Carlo Search #####################
+
+# Anytime alternative to SearchEngine for pools too large to search exactly. Each
+# iteration walks down the tree with UCT, adds one node, finishes the sequence with
+# a random playout of the remaining pool and backs the score up. Scores are
+# rescaled to [0, 1] with the lowest and highest playout seen so far, and the
+# minimizer picks children by 1 - q. The answer follows the most visited child
+# from the root and completes the line greedily once it leaves the tree.
+#
+# Game rules (next occurrence per distinct symbol, booster states) come from a
+# SearchEngine, so both solvers score a line identically. With a node_limit and a
+# seed the search is reproducible; a time_limit stops whenever the clock runs out.
+# Every iteration adds at most one node, so node_limit caps the iterations.
+class MonteCarloNode:
+    def __init__(self, move, untried):
+        self.move = move
+        self.untried = untried
+        self.children = []
+        self.visits = 0
+        self.total = 0.0
+
+class MonteCarloSearch:
+    def __init__(self, pool, cost_table, booster_enabled = False, seed = None, exploration = 1.4):
+        self.engine = SearchEngine(pool, cost_table, booster_enabled, TranspositionTable(0), MoveOrdering(enabled = False))
+        self.random = random.Random(seed)
+        self.exploration = exploration
+        self.nodes = 0
+        self.iterations = 0
+        self.visits = 0
+        self.confidence = 0.0
+
+    def search(self, time_limit = None, node_limit = None):
+        if time_limit is None and node_limit is None:
+            raise ValueError("Monte Carlo search needs a time_limit or a node_limit")
+        engine = self.engine
+        cost_table = engine.cost_table
+        symbols = engine.symbols
+        occurrences = engine.occurrences
+        play = engine._play
+        rng = self.random
+        exploration = self.exploration
+        n = len(engine.pool)
+        if n == 0:
+            return cost_table.finish(0), ""
+
+        root = MonteCarloNode(None, list(range(len(symbols))))
+        self.nodes = 1
+        self.iterations = 0
+        lowest = float('inf')
+        highest = float('-inf')
+        deadline = None if time_limit is None else time.perf_counter() + time_limit
+        buffer = [None] * n
+
+        while True:
+            node = root
+            path = [root]
+            taken = [0] * len(symbols)
+            depth = 0
+            score = 0
+            state = 0
+
+            # Selection: descend while every move of the node already has a child.
+            while not node.untried and node.children:
+                log_visits = math.log(node.visits)
+                spread = highest - lowest
+                maximizing = depth % 2 == 0
+                best_child = None
+                best_priority = float('-inf')
+                for child in node.children:
+                    q = (child.total / child.visits - lowest) / spread if spread > 0 else 0.5
+                    if not maximizing:
+                        q = 1 - q
+                    priority = q + exploration * math.sqrt(log_visits / child.visits)
+                    if priority > best_priority:
+                        best_child = child
+                        best_priority = priority
+                node = best_child
+                path.append(node)
+                buffer[depth] = symbols[node.move]
+                score, state = play(buffer, depth, score, state)
+                taken[node.move] += 1
+                depth += 1
+
+            # Expansion: one untried move becomes a child.
+            if node.untried:
+                move = node.untried.pop(rng.randrange(len(node.untried)))
+                buffer[depth] = symbols[move]
+                score, state = play(buffer, depth, score, state)
+                taken[move] += 1
+                depth += 1
+                remaining = [s for s in range(len(symbols)) if taken[s] < len(occurrences[s])]
+                child = MonteCarloNode(move, remaining)
+                node.children.append(child)
+                path.append(child)
+                self.nodes += 1
+
+            # Playout: the rest of the pool in random order.
+            rest = []
+            for s in range(len(symbols)):
+                rest.extend([s] * (len(occurrences[s]) - taken[s]))
+            rng.shuffle(rest)
+            for s in rest:
+                buffer[depth] = symbols[s]
+                score, state = play(buffer, depth, score, state)
+                depth += 1
+            value = cost_table.finish(score, state == 1)
+
+            lowest = min(lowest, value)
+            highest = max(highest, value)
+            for visited in path:
+                visited.visits += 1
+                visited.total += value
+            self.iterations += 1
+
+            if node_limit is not None and self.iterations >= node_limit:
+                break
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+
+        return self._principal_line(root, buffer)
+
+    def _principal_line(self, root, buffer):
+        engine = self.engine
+        symbols = engine.symbols
+        occurrences = engine.occurrences
+        play = engine._play
+        n = len(engine.pool)
+        taken = [0] * len(symbols)
+        score = 0
+        state = 0
+        node = root
+        best_child = max(root.children, key = lambda child: child.visits)
+        self.visits = root.visits
+        self.confidence = best_child.visits / root.visits
+
+        for depth in range(n):
+            if node is not None and node.children:
+                node = max(node.children, key = lambda child: (child.visits, -occurrences[child.move][taken[child.move]]))
+                move = node.move
+            else:
+                # Past the tree: each side takes the move that is best for it right
+                # now, earliest in the pool on ties.
+                node = None
+                move = None
+                best_score = None
+                for s in range(len(symbols)):
+                    if taken[s] == len(occurrences[s]):
+                        continue
+                    buffer[depth] = symbols[s]
+                    next_score = play(buffer, depth, score, state)[0]
+                    if move is None or (next_score > best_score if depth % 2 == 0 else next_score < best_score) \
+                            or (next_score == best_score and occurrences[s][taken[s]] < occurrences[move][taken[move]]):
+                        move = s
+                        best_score = next_score
+            buffer[depth] = symbols[move]
+            score, state = play(buffer, depth, score, state)
+            taken[move] += 1
+        return engine.cost_table.finish(score, state == 1), "".join(buffer)
+
+
+# Solver front end with the same shape as AlphaBetaPruning / BoosterAlphaBeta, for
+# either utility calculator.
+class MonteCarloSolver:
+    def __init__(self, pool, utility_object, booster_enabled = False, time_limit = None, node_limit = None, seed = None):
+        if time_limit is None and node_limit is None:
+            raise ValueError("Monte Carlo search needs a time_limit or a node_limit")
+        self.pool = pool
+        self.utility_object = utility_object
+        self.booster_enabled = booster_enabled
+        self.time_limit = time_limit
+        self.node_limit = node_limit
+        self.seed = seed
+        self.nodes = 0
+        self.visits = 0
+        self.confidence = 0.0
+
+    def solve(self):
+        cost_table = self.utility_object.cost_table(len(self.pool), set(self.pool))
+        search = MonteCarloSearch(self.pool, cost_table, self.booster_enabled, self.seed)
+        result = search.search(self.time_limit, self.node_limit)
+        self.nodes = search.nodes
+        self.visits = search.visits
+        self.confidence = search.confidence
+        return result
+
+    def run_solver(self):
+        return self.solve()
+
+    def summary(self, score, best_sequence):
+        return {"best_sequence": best_sequence, "score": score, "nodes": self.nodes, "visits": self.visits, "confidence": round(self.confidence, 4)}
@@ -0,0 +1,227 @@
+from .batch_scoring import _numpy
+from .substitution import substitution_matrix
+from .transposition import EXACT, LOWER_BOUND, UPPER_BOUND, TranspositionTable
+from .without_booster import AlphaBetaPruning, UtilityCalculator
+
+##################### Multi-Target Search #####################
+
+# One alpha-beta walk of the pool's tree for many targets at once. Each node
+# carries a NumPy vector of running scores, one per target, and its own alpha and
+# beta per target. A target leaves a node as soon as its window closes there, so
+# children are only searched for targets still open, and a node is cut off once
+# none are.
+#
+# Moves are tried in pool order, so a later move only replaces the best on a
+# strictly better score and every target gets the first optimal line in pool
+# order, the one its own SearchEngine returns. Scores are float64 and subtracted
+# one position at a time like the engine's running score. That makes them exact
+# for any cost table with fits_float64 set. The final score is then recomputed
+# from the line with the target's cost table.
+#
+# Lines are packed as integers, one digit per position holding the symbol's id
+# (see packed.py). The transposition table keeps, per remaining pool, one flag,
+# one line and one prefix score per target; a target without an entry yet has
+# flag MISSING. As in SearchEngine, a target's line is only reused below another
+# prefix when its costs are ints; otherwise the prefix score has to match.
+MISSING = -1
+
+class MultiTargetSearch:
+    def __init__(self, pool, cost_tables, transposition_table = None):
+        np = _numpy()
+        self.pool = list(pool)
+        self.cost_tables = list(cost_tables)
+        if transposition_table is None:
+            # Entries grow with the number of targets: keep about 4M per-target slots.
+            transposition_table = TranspositionTable(max(1, 4_000_000 // max(1, len(self.cost_tables))))
+        self.transposition_table = transposition_table
+        self.nodes = 0
+
+        self.symbols = []
+        self.occurrences = []
+        ids = {}
+        for i in range(len(self.pool)):
+            nucleotide = self.pool[i]
+            if nucleotide not in ids:
+                ids[nucleotide] = len(self.symbols)
+                self.symbols.append(nucleotide)
+                self.occurrences.append([])
+            self.occurrences[ids[nucleotide]].append(i)
+        self.radix = []
+        stride = 1
+        for occurrence in self.occurrences:
+            self.radix.append(stride)
+            stride *= len(occurrence) + 1
+
+        n = len(self.pool)
+        self.bits = max(1, (len(self.symbols) - 1).bit_length())
+        self.mask = (1 << self.bits) - 1
+        self.line_type = np.int64 if self.bits * n <= 62 else object
+        # rows[d, s] holds the cost of symbol s at position d for every target.
+        self.rows = np.zeros((n, len(self.symbols), len(self.cost_tables)), dtype = np.float64)
+        for t in range(len(self.cost_tables)):
+            for d in range(n):
+                row = self.cost_tables[t].rows[d]
+                for s in range(len(self.symbols)):
+                    self.rows[d, s, t] = row[self.symbols[s]]
+        # Shorter tails are padded with 0.0, which subtracts nothing.
+        tail_length = max([len(table.tail) for table in self.cost_tables], default = 0)
+        self.tails = np.zeros((tail_length, len(self.cost_tables)), dtype = np.float64)
+        for t in range(len(self.cost_tables)):
+            tail = self.cost_tables[t].tail
+            self.tails[:len(tail), t] = tail
+        self.exact = np.array([table.int_costs for table in self.cost_tables], dtype = bool)
+
+    # Returns (score, best_sequence) per cost table, in order.
+    def search(self):
+        np = _numpy()
+        self.nodes = 0
+        count = len(self.cost_tables)
+        if count == 0:
+            return []
+        if not self.pool:
+            self.nodes = 1
+            return [(table.finish(0), "") for table in self.cost_tables]
+        targets = np.arange(count)
+        _, lines = self._search(0, 0, [0] * len(self.symbols), targets, np.zeros(count),
+                                np.full(count, float('-inf')), np.full(count, float('inf')))
+        results = []
+        for t in range(count):
+            line = self.decode(lines[t], len(self.pool))
+            results.append((self.cost_tables[t].score(line), line))
+        return results
+
+    def decode(self, code, length):
+        code = int(code)
+        return "".join(self.symbols[code >> self.bits * (length - 1 - i) & self.mask] for i in range(length))
+
+    def _search(self, depth, code, taken, targets, scores, alpha, beta):
+        np = _numpy()
+        n = len(self.pool)
+        self.nodes += 1
+        if depth == n:
+            for position in range(len(self.tails)):
+                scores = scores - self.tails[position][targets]
+            return scores, np.zeros(len(targets), dtype = self.line_type)
+
+        # Nodes with a single move left are cheaper to search than to look up.
+        if depth == 0 or n - depth == 1:
+            return self._expand(depth, code, taken, targets, scores, alpha, beta)
+
+        table = self.transposition_table
+        entry = table.probe(code)
+        if entry is None:
+            # The line slot holds the lines and the prefix scores they were found under.
+            entry = (np.full(len(self.cost_tables), MISSING, dtype = np.int8),
+                     (np.zeros(len(self.cost_tables), dtype = self.line_type), np.zeros(len(self.cost_tables))))
+            table.store(code, *entry)
+        flags, (lines, prefixes) = entry
+        values = np.empty(len(targets))
+        best_lines = np.zeros(len(targets), dtype = self.line_type)
+        flag = flags[targets]
+        known = np.flatnonzero((flag != MISSING) & (self.exact[targets] | (prefixes[targets] == scores)))
+        usable = np.zeros(len(targets), dtype = bool)
+        if known.size:
+            known_targets = targets[known]
+            stored = lines[known_targets]
+            value = self.rescore(depth, known_targets, scores[known], stored)
+            flag = flag[known]
+            usable[known] = (flag == EXACT) | ((flag == LOWER_BOUND) & (value >= beta[known])) | ((flag == UPPER_BOUND) & (value <= alpha[known]))
+            values[known] = value
+            best_lines[known] = stored
+        rest = np.flatnonzero(~usable)
+        if rest.size:
+            rest_targets = targets[rest]
+            value, line = self._expand(depth, code, taken, rest_targets, scores[rest], alpha[rest], beta[rest])
+            values[rest] = value
+            best_lines[rest] = line
+            flags[rest_targets] = np.where(value <= alpha[rest], UPPER_BOUND, np.where(value >= beta[rest], LOWER_BOUND, EXACT))
+            lines[rest_targets] = line
+            prefixes[rest_targets] = scores[rest]
+        return values, best_lines
+
+    def _expand(self, depth, code, taken, targets, scores, alpha, beta):
+        np = _numpy()
+        n = len(self.pool)
+        maximizing = not depth & 1
+        best = np.full(len(targets), float('-inf') if maximizing else float('inf'))
+        best_lines = np.zeros(len(targets), dtype = self.line_type)
+        alpha = alpha.copy()
+        beta = beta.copy()
+        open_targets = np.arange(len(targets))
+        shift = self.bits * (n - depth - 1)
+        moves = sorted((self.occurrences[s][taken[s]], s) for s in range(len(self.symbols)) if taken[s] < len(self.occurrences[s]))
+        for _, s in moves:
+            child_targets = targets[open_targets]
+            child_scores = scores[open_targets] - self.rows[depth, s][child_targets]
+            taken[s] += 1
+            value, line = self._search(depth + 1, code + self.radix[s], taken, child_targets, child_scores, alpha[open_targets], beta[open_targets])
+            taken[s] -= 1
+            current = best[open_targets]
+            improved = value > current if maximizing else value < current
+            best[open_targets] = np.where(improved, value, current)
+            best_lines[open_targets] = np.where(improved, line | (s << shift), best_lines[open_targets])
+            if maximizing:
+                alpha[open_targets] = np.maximum(alpha[open_targets], value)
+            else:
+                beta[open_targets] = np.minimum(beta[open_targets], value)
+            open_targets = open_targets[alpha[open_targets] < beta[open_targets]]
+            if not open_targets.size:
+                break
+        return best, best_lines
+
+    # Scores stored lines from this node, the way the leaves below it would be.
+    def rescore(self, depth, targets, scores, lines):
+        np = _numpy()
+        n = len(self.pool)
+        for position in range(depth, n):
+            digits = (lines >> self.bits * (n - 1 - position) & self.mask).astype(np.intp)
+            scores = scores - self.rows[position][digits, targets]
+        for position in range(len(self.tails)):
+            scores = scores - self.tails[position][targets]
+        return scores
+
+
+# Solves `pool` against every target in one MultiTargetSearch, with the results a
+# GeneSequence per target would give. `weights` is one list for all targets or a
+# list per target; each is cut to the target's length as GeneSequence does.
+# Targets whose costs do not fit float64 are solved on their own.
+class MultiTargetGeneSequence:
+    def __init__(self, pool, targets, weights, matrix = None):
+        self.pool = pool
+        self.targets = list(targets)
+        if weights and all(isinstance(weight, (list, tuple)) for weight in weights):
+            if len(weights) != len(self.targets):
+                raise ValueError(f"{len(weights)} weight lists for {len(self.targets)} targets")
+            weight_lists = weights
+        else:
+            weight_lists = [weights] * len(self.targets)
+        self.weights = [list(weight_lists[t])[-len(self.targets[t]):] for t in range(len(self.targets))]
+        self.matrix = substitution_matrix(matrix)
+        self.utility_calculators = [UtilityCalculator(self.targets[t], self.weights[t], self.matrix) for t in range(len(self.targets))]
+        self.nodes = 0
+
+    def solve(self):
+        symbols = set(self.pool)
+        cost_tables = [calculator.cost_table(len(self.pool), symbols) for calculator in self.utility_calculators]
+        shared = [t for t in range(len(cost_tables)) if cost_tables[t].fits_float64]
+        results = [None] * len(cost_tables)
+        self.nodes = 0
+        if shared:
+            search = MultiTargetSearch(self.pool, [cost_tables[t] for t in shared])
+            for t, result in zip(shared, search.search()):
+                results[t] = result
+            self.nodes += search.nodes
+        for t in range(len(cost_tables)):
+            if results[t] is None:
+                solver = AlphaBetaPruning(self.pool, self.utility_calculators[t])
+                results[t] = solver.solve()
+                self.nodes += solver.nodes
+        return results
+
+    def run(self):
+        results = self.solve()
+        for target, (utility_score, best_sequence) in zip(self.targets, results):
+            print(f"Target: {target}")
+            print(f"Best gene sequence generated: {best_sequence}")
+            print(f"Utility score: {utility_score}")
+        return results
@@ -0,0 +1,55 @@
+##################### Move Ordering #####################
+
+# Tries the cheapest position cost first for the maximizer and the most expensive
+# first for the minimizer, after any killer moves for the depth and ranked by the
+# history of cutoffs. The solvers only change the order moves are searched in;
+# ties are still resolved in pool order (see the windows in the search loops).
+class MoveOrdering:
+    def __init__(self, killer_slots = 2, enabled = True):
+        self.killer_slots = killer_slots
+        self.enabled = enabled
+        self.killers = {}
+        self.history = {}
+        self.cutoffs = 0
+        self.first_move_cutoffs = 0
+
+    def order(self, pool, indices, row, depth, maximizing):
+        if not self.enabled:
+            return indices
+        killers = self.killers.get(depth, ())
+        history = self.history
+
+        def rank(i):
+            symbol = pool[i]
+            killer = killers.index(symbol) if symbol in killers else len(killers)
+            cost = row[symbol] if maximizing else -row[symbol]
+            return (killer, -history.get((depth, symbol), 0), cost, i)
+
+        return sorted(indices, key = rank)
+
+    def record_cutoff(self, depth, symbol, remaining, move_number):
+        self.cutoffs += 1
+        if move_number == 0:
+            self.first_move_cutoffs += 1
+        if not self.enabled:
+            return
+        killers = self.killers.setdefault(depth, [])
+        if symbol in killers:
+            killers.remove(symbol)
+        killers.insert(0, symbol)
+        del killers[self.killer_slots:]
+        self.history[(depth, symbol)] = self.history.get((depth, symbol), 0) + remaining * remaining
+
+    def first_move_cutoff_rate(self):
+        if self.cutoffs == 0:
+            return 0.0
+        return self.first_move_cutoffs / self.cutoffs
+
+    def reset_counters(self):
+        self.cutoffs = 0
+        self.first_move_cutoffs = 0
+
+    def clear(self):
+        self.killers.clear()
+        self.history.clear()
+        self.reset_counters()
@@ -0,0 +1,62 @@
+##################### Packed Sequences #####################
+
+# Each symbol of an alphabet is a digit in base 2 ** bits: 2 bits for the four
+# nucleotides, 3 once the booster "S" joins them, more only for larger alphabets.
+# A sequence is the integer whose digits are its symbols, first symbol most
+# significant, so the conversions to and from str run in int() and format()
+# rather than a Python loop.
+class Alphabet:
+    def __init__(self, symbols):
+        self.symbols = "".join(sorted(set(symbols)))
+        if not self.symbols:
+            raise ValueError("an alphabet needs at least one symbol")
+        self.bits = 2 if len(self.symbols) <= 4 else max(3, (len(self.symbols) - 1).bit_length())
+        self.mask = (1 << self.bits) - 1
+        self.digits = {symbol: digit for digit, symbol in enumerate(self.symbols)}
+        digit_characters = "0123456789abcdefghijklmnopqrstuv"
+        if self.bits <= 5:
+            self.base = 1 << self.bits
+            self.to_digits = str.maketrans(self.symbols, digit_characters[:len(self.symbols)])
+        else:
+            self.base = None
+        # Four 2-bit digits per byte, one 3-bit digit per octal digit.
+        if self.bits == 2:
+            self.quads = ["".join(self.symbol(byte >> shift & 3) for shift in (6, 4, 2, 0)) for byte in range(256)]
+            self.from_digits = None
+        elif self.bits == 3:
+            self.from_digits = str.maketrans({str(digit): self.symbol(digit) for digit in range(8)})
+            self.digit_format = "o"
+        elif self.bits == 4:
+            self.from_digits = str.maketrans({format(digit, "x"): self.symbol(digit) for digit in range(16)})
+            self.digit_format = "x"
+        else:
+            self.from_digits = None
+        self.specifications = {}
+
+    def symbol(self, digit):
+        return self.symbols[digit] if digit < len(self.symbols) else self.symbols[0]
+
+    def encode(self, text):
+        if not text:
+            return 0
+        if self.base is not None:
+            return int(text.translate(self.to_digits), self.base)
+        code = 0
+        for symbol in text:
+            code = code << self.bits | self.digits[symbol]
+        return code
+
+    def decode(self, code, length):
+        if length == 0:
+            return ""
+        if self.bits == 2:
+            text = "".join(map(self.quads.__getitem__, code.to_bytes((length + 3) // 4, "big")))
+            return text[len(text) - length:]
+        if self.from_digits is None:
+            return "".join(self.symbols[code >> (self.bits * (length - 1 - i)) & self.mask] for i in range(length))
+        specification = self.specifications.get(length)
+        if specification is None:
+            specification = "0%d%s" % (length, self.digit_format)
+            self.specifications[length] = specification
+        return format(code, specification).translate(self.from_digits)
+
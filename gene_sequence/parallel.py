@@ -0,0 +1,99 @@
+import math
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from .stats import SearchStats
+
+##################### Parallel Search #####################
+
+# Young Brothers Wait at the root: the first root move (in search order) is searched
+# here, the remaining root moves - or, with split_depth = 2, every reply to them -
+# are searched by a process pool. Workers share the best root score found so far
+# through a multiprocessing.Value and prune against it. Each task is searched one
+# ulp below that bound, so any move that ties the final score comes back exact,
+# and the results are folded in pool order: the answer never depends on which
+# worker finishes first and matches the serial search.
+_worker_engine = None
+_worker_bound = None
+
+def _init_worker(engine, shared_bound):
+    global _worker_engine, _worker_bound
+    _worker_engine = engine
+    _worker_bound = shared_bound
+
+def _search_task(prefix):
+    if _worker_engine.stats is not None:
+        _worker_engine.stats = SearchStats()
+    alpha = math.nextafter(_worker_bound.value, float('-inf'))
+    value, line = _worker_engine.search(prefix, alpha, float('inf'), _worker_bound)
+    exact = _worker_engine.exact
+    if exact and len(prefix) == 1:
+        with _worker_bound.get_lock():
+            if value > _worker_bound.value:
+                _worker_bound.value = value
+    return value, line, exact, _worker_engine.nodes, _worker_engine.bound_cutoffs, _worker_engine.stats
+
+class ParallelSearch:
+    def __init__(self, engine, workers = None, split_depth = 1):
+        self.engine = engine
+        self.workers = workers or os.cpu_count() or 1
+        self.split_depth = split_depth
+        self.nodes = 0
+        self.bound_cutoffs = 0
+
+    def search(self):
+        engine = self.engine
+        root_moves = engine.candidates()
+        if self.workers <= 1 or len(root_moves) <= 1:
+            result = engine.search()
+            self.nodes = engine.nodes
+            self.bound_cutoffs = engine.bound_cutoffs
+            return result
+        root_moves = list(engine.move_ordering.order(engine.pool, root_moves, engine.cost_table.rows[0], 0, True))
+
+        first = root_moves[0]
+        best_score, best_sequence = engine.search((first,))
+        best_index = first
+        self.nodes = engine.nodes + 1
+        self.bound_cutoffs = engine.bound_cutoffs
+
+        tasks = []
+        for move in root_moves[1:]:
+            if self.split_depth >= 2 and len(engine.pool) > 2:
+                for reply in engine.candidates((move,)):
+                    tasks.append((move, reply))
+            else:
+                tasks.append((move,))
+
+        shared_bound = multiprocessing.Value('d', best_score)
+        with ProcessPoolExecutor(max_workers = self.workers, initializer = _init_worker, initargs = (engine, shared_bound)) as executor:
+            results = list(executor.map(_search_task, tasks))
+
+        # A root move's score is the minimum over its replies; a reply that came back
+        # as a bound means the move cannot reach the best score.
+        outcomes = {}
+        for prefix, (value, line, exact, nodes, bound_cutoffs, stats) in zip(tasks, results):
+            self.nodes += nodes
+            self.bound_cutoffs += bound_cutoffs
+            if stats is not None:
+                engine.stats.merge(stats)
+            move = prefix[0]
+            if move not in outcomes:
+                outcomes[move] = [float('inf'), None, len(engine.pool), True]
+            outcome = outcomes[move]
+            reply = prefix[-1]
+            if not exact:
+                outcome[3] = False
+            elif value < outcome[0] or (value == outcome[0] and reply < outcome[2]):
+                outcome[0] = value
+                outcome[1] = line
+                outcome[2] = reply
+
+        for move in root_moves[1:]:
+            value, line, _, exact = outcomes[move]
+            if exact and (value > best_score or (value == best_score and move < best_index)):
+                best_score = value
+                best_sequence = line
+                best_index = move
+        return best_score, best_sequence
@@ -0,0 +1,177 @@
+import hashlib
+import json
+import os
+import sqlite3
+
+##################### Result Cache #####################
+
+# Bumped whenever solved results change shape, so old cache files stop matching.
+CACHE_VERSION = 1
+
+# Solved instances kept in a SQLite file and shared by every process that opens
+# it. Entries are keyed by fingerprint() and evicted least recently used once
+# there are more than max_entries. Each process opens its own connection; writes
+# (a hit also moves the entry to the front) take the database lock in turn.
+#
+# hits, misses, stores, evictions, verified and mismatches count this object's
+# calls; metrics() adds the totals of every process that used the file.
+class ResultCache:
+    def __init__(self, path, max_entries = 100_000, timeout = 30.0):
+        self.path = path
+        self.max_entries = max_entries
+        self.timeout = timeout
+        self.connection = None
+        self.pid = None
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+        self.verified = 0
+        self.mismatches = 0
+
+    # The same instance gives the same fingerprint whatever order the pool is in.
+    # The score is all that depends on: with tied scores, the sequence of a hit is
+    # the one found for the pool order that was solved first.
+    @staticmethod
+    def fingerprint(kind, pool, target, weights, multiplier = None, matrix = None):
+        instance = [CACHE_VERSION, kind, "".join(sorted(pool)), target, list(weights), multiplier]
+        # The original ord scoring keeps the keys it had before matrices existed.
+        if matrix is not None and matrix.spec() != "ord":
+            instance.append(matrix.spec())
+        return hashlib.sha256(json.dumps(instance).encode()).hexdigest()
+
+    def connect(self):
+        # A forked worker must not share its parent's connection.
+        if self.connection is None or self.pid != os.getpid():
+            connection = sqlite3.connect(self.path, timeout = self.timeout, isolation_level = None)
+            connection.execute("PRAGMA journal_mode = WAL")
+            connection.execute("PRAGMA synchronous = NORMAL")
+            connection.execute("CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, value TEXT NOT NULL, used INTEGER NOT NULL)")
+            connection.execute("CREATE INDEX IF NOT EXISTS results_used ON results (used)")
+            connection.execute("CREATE TABLE IF NOT EXISTS metrics (name TEXT PRIMARY KEY, count INTEGER NOT NULL)")
+            self.connection = connection
+            self.pid = os.getpid()
+        return self.connection
+
+    def get(self, key):
+        connection = self.connect()
+        with Transaction(connection):
+            row = connection.execute("SELECT value FROM results WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                count(connection, "misses")
+                return None
+            connection.execute("UPDATE results SET used = (SELECT MAX(used) FROM results) + 1 WHERE key = ?", (key,))
+            self.hits += 1
+            count(connection, "hits")
+        return json.loads(row[0])
+
+    def put(self, key, value):
+        if self.max_entries <= 0:
+            return
+        connection = self.connect()
+        with Transaction(connection):
+            connection.execute("INSERT OR REPLACE INTO results (key, value, used) VALUES (?, ?, (SELECT COALESCE(MAX(used), 0) + 1 FROM results))",
+                               (key, json.dumps(value)))
+            evicted = connection.execute("DELETE FROM results WHERE used <= (SELECT used FROM results ORDER BY used DESC LIMIT 1 OFFSET ?)",
+                                         (self.max_entries,)).rowcount
+            self.stores += 1
+            count(connection, "stores")
+            if evicted > 0:
+                self.evictions += evicted
+                count(connection, "evictions", evicted)
+
+    # Returns (value, hit). On a miss compute() is solved and stored. With verify,
+    # a hit is solved again and check(value) of both must agree; the fresh result
+    # is returned and replaces the entry either way.
+    def fetch(self, key, compute, check, verify = False):
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            self.put(key, value)
+            return value, False
+        if not verify:
+            return value, True
+        fresh = compute()
+        self.verified += 1
+        if check(json.loads(json.dumps(fresh))) != check(value):
+            self.mismatches += 1
+            count(self.connect(), "mismatches")
+        self.put(key, fresh)
+        return fresh, True
+
+    def hit_rate(self):
+        if self.hits + self.misses == 0:
+            return 0.0
+        return self.hits / (self.hits + self.misses)
+
+    def metrics(self):
+        connection = self.connect()
+        totals = dict(connection.execute("SELECT name, count FROM metrics").fetchall())
+        return {
+            "path": self.path,
+            "entries": len(self),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "stores": self.stores,
+            "evictions": self.evictions,
+            "verified": self.verified,
+            "mismatches": self.mismatches,
+            "hit_rate": round(self.hit_rate(), 4),
+            "totals": {name: totals.get(name, 0) for name in ("hits", "misses", "stores", "evictions", "mismatches")},
+        }
+
+    def clear(self):
+        connection = self.connect()
+        with Transaction(connection):
+            connection.execute("DELETE FROM results")
+            connection.execute("DELETE FROM metrics")
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+        self.verified = 0
+        self.mismatches = 0
+
+    def close(self):
+        if self.connection is not None and self.pid == os.getpid():
+            self.connection.close()
+        self.connection = None
+
+    def __len__(self):
+        return self.connect().execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        state["connection"] = None
+        return state
+
+
+# BEGIN IMMEDIATE takes the write lock up front, so two processes never both read
+# and then fail to upgrade.
+class Transaction:
+    def __init__(self, connection):
+        self.connection = connection
+
+    def __enter__(self):
+        self.connection.execute("BEGIN IMMEDIATE")
+
+    def __exit__(self, kind, value, traceback):
+        self.connection.execute("COMMIT" if kind is None else "ROLLBACK")
+
+
+def count(connection, name, amount = 1):
+    connection.execute("INSERT INTO metrics (name, count) VALUES (?, ?) ON CONFLICT (name) DO UPDATE SET count = count + excluded.count",
+                       (name, amount))
+
+
+# One ResultCache per path in each process, for batch workers.
+_open_caches = {}
+
+def open_cache(path):
+    cache = _open_caches.get(path)
+    if cache is None:
+        cache = ResultCache(path)
+        _open_caches[path] = cache
+    return cache
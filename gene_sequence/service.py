@@ -0,0 +1,307 @@
+import asyncio
+import json
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from .batch import solve_record
+from .booster import UtilityWithBooster
+from .without_booster import UtilityCalculator
+
+##################### Solve Service #####################
+
+# A long-running solver speaking JSON lines over a Unix socket ("unix:/path") or
+# localhost TCP ("127.0.0.1:8765"). One request per line, one response per line,
+# matched by "id"; requests on a connection are answered as they finish.
+#
+#   {"id": 1, "op": "solve", "pool": "SATGC", "target": "GCAT", "weights": [...],
+#    "booster": true, "timeout": 5}      fields as for a batch job
+#   {"id": 2, "op": "utility", "sequence": "GCAT", "target": "GCAT", "weights": [...],
+#    "booster_index": 2, "multiplier": 0.23, "matrix": "transition-transversion"}
+#   {"id": 3, "op": "cancel", "cancel": 1}
+#   {"id": 4, "op": "stats"}
+#
+# Responses carry "status": "ok", "error", "busy" (too many searches in flight),
+# "timeout" or "cancelled". Searches run in a process pool of `workers`;
+# identical solve requests in flight share one search. A timeout or cancel only
+# drops the request: the search is cancelled once nothing waits on it if it has
+# not started yet, and otherwise finishes in its worker and is discarded. Until
+# then it holds that worker; stats() reports such searches as "abandoned".
+class SolveService:
+    def __init__(self, workers = None, max_pending = 64, timeout = None, cache = None, history = 1000):
+        self.workers = workers or os.cpu_count() or 1
+        self.max_pending = max_pending
+        self.timeout = timeout
+        self.cache = cache
+        self.executor = None
+        # Search key -> [future, number of requests waiting on it, executor future, executor].
+        self.in_flight = {}
+        # Searches nothing waits on any more that are still running in a worker.
+        self.abandoned = set()
+        self.latencies = deque(maxlen = history)
+        self.counts = {"requests": 0, "searches": 0, "coalesced": 0, "rejected": 0, "timeouts": 0, "cancelled": 0, "abandoned": 0, "errors": 0, "restarts": 0}
+        self.started = time.time()
+
+    # Workers start on demand, while connections are open. Forked workers would
+    # inherit the client sockets and keep them open, so they come from a fork
+    # server where there is one.
+    def start(self):
+        if self.executor is None:
+            import multiprocessing
+            method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+            self.executor = ProcessPoolExecutor(max_workers = self.workers, mp_context = multiprocessing.get_context(method))
+
+    # Queued searches are dropped; ones already running are waited for.
+    def close(self):
+        if self.executor is not None:
+            self.executor.shutdown(wait = True, cancel_futures = True)
+            self.executor = None
+
+    async def solve(self, job, timeout = None):
+        job = {name: value for name, value in job.items() if name not in ("id", "op", "timeout")}
+        key = json.dumps(job, sort_keys = True)
+        entry = self.in_flight.get(key)
+        if entry is None:
+            if len(self.in_flight) >= self.max_pending:
+                self.counts["rejected"] += 1
+                raise ServiceBusy(f"{len(self.in_flight)} searches in flight")
+            self.start()
+            executor = self.executor
+            try:
+                work = executor.submit(solve_record, 0, job, self.cache)
+            except BrokenProcessPool:
+                self.restart(executor)
+                self.start()
+                executor = self.executor
+                work = executor.submit(solve_record, 0, job, self.cache)
+            future = asyncio.wrap_future(work)
+            entry = [future, 0, work, executor]
+            self.in_flight[key] = entry
+            future.add_done_callback(lambda _: self.forget(key, entry))
+            self.counts["searches"] += 1
+        else:
+            self.counts["coalesced"] += 1
+        entry[1] += 1
+        try:
+            result = await asyncio.wait_for(asyncio.shield(entry[0]), timeout)
+        except BrokenProcessPool:
+            self.restart(entry[3])
+            raise
+        finally:
+            entry[1] -= 1
+            if entry[1] == 0 and not entry[0].done():
+                if entry[2].cancel():
+                    entry[0].cancel()
+                else:
+                    # Already running: the worker stays busy until it finishes.
+                    self.abandoned.add(entry[0])
+                    entry[0].add_done_callback(self.discard)
+                    self.counts["abandoned"] += 1
+                self.forget(key, entry)
+        result = dict(result)
+        del result["index"]
+        return result
+
+    def forget(self, key, entry):
+        if self.in_flight.get(key) is entry:
+            del self.in_flight[key]
+
+    # A worker died: the pool has failed every search it held and takes no more,
+    # so it is replaced by a new one on the next solve.
+    def restart(self, executor):
+        if self.executor is executor:
+            self.executor = None
+            executor.shutdown(wait = False, cancel_futures = True)
+            self.counts["restarts"] += 1
+        for key, entry in list(self.in_flight.items()):
+            if entry[3] is executor:
+                self.forget(key, entry)
+
+    def discard(self, future):
+        self.abandoned.discard(future)
+        if not future.cancelled():
+            # Nobody reads the outcome; retrieve it so a failure is not logged.
+            future.exception()
+
+    async def handle(self, request):
+        started = time.perf_counter()
+        self.counts["requests"] += 1
+        response = {"id": request["id"]} if "id" in request else {}
+        operation = request.get("op", "solve")
+        try:
+            if operation == "solve":
+                response.update(await self.solve(request, request.get("timeout", self.timeout)))
+                response["status"] = "error" if "error" in response else "ok"
+            elif operation == "utility":
+                response["utility"] = utility(request)
+                response["status"] = "ok"
+            elif operation == "stats":
+                response["stats"] = self.stats()
+                response["status"] = "ok"
+            else:
+                raise ValueError(f"unknown op {operation!r}")
+        except ServiceBusy as error:
+            response.update({"status": "busy", "error": str(error)})
+        except asyncio.TimeoutError:
+            self.counts["timeouts"] += 1
+            response.update({"status": "timeout", "error": "timed out"})
+        except Exception as error:
+            # A bad request, or a worker process that died: report it and keep serving.
+            response.update({"status": "error", "error": f"{type(error).__name__}: {error}"})
+        if response["status"] == "error":
+            self.counts["errors"] += 1
+        self.latencies.append(time.perf_counter() - started)
+        return response
+
+    async def serve_connection(self, reader, writer):
+        pending = {}
+        lock = asyncio.Lock()
+
+        async def send(response):
+            async with lock:
+                writer.write(json.dumps(response).encode() + b"\n")
+                await writer.drain()
+
+        async def answer(request):
+            response = await self.handle(request)
+            try:
+                await send(response)
+            except ConnectionError:
+                pass
+
+        # A task can be cancelled before it starts, so the cancelled answer is sent
+        # from here rather than from answer().
+        def finished(task, request_id, request):
+            if pending.get(request_id) is task:
+                del pending[request_id]
+            if task.cancelled():
+                self.counts["cancelled"] += 1
+                asyncio.ensure_future(answer_cancelled(request))
+
+        async def answer_cancelled(request):
+            try:
+                await send({"id": request.get("id"), "status": "cancelled"})
+            except ConnectionError:
+                pass
+
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    # The client is done sending: answer what it already asked.
+                    await asyncio.gather(*pending.values(), return_exceptions = True)
+                    break
+                if not line.strip():
+                    continue
+                try:
+                    request = json.loads(line)
+                    if not isinstance(request, dict):
+                        raise ValueError("a request is a JSON object")
+                except ValueError as error:
+                    await send({"status": "error", "error": f"{type(error).__name__}: {error}"})
+                    continue
+                # Ids can be any JSON value, so they are matched by their encoding.
+                if request.get("op") == "cancel":
+                    task = pending.get(json.dumps(request.get("cancel")))
+                    if task is not None:
+                        task.cancel()
+                    await send({"id": request.get("id"), "status": "ok", "cancelled": task is not None})
+                    continue
+                task = asyncio.ensure_future(answer(request))
+                request_id = json.dumps(request.get("id"))
+                pending[request_id] = task
+                task.add_done_callback(lambda task, request_id = request_id, request = request: finished(task, request_id, request))
+        except (ConnectionError, ValueError, asyncio.CancelledError):
+            # The client is gone, sent a line over the limit, or the server is
+            # shutting down: drop what it waits for.
+            for task in list(pending.values()):
+                task.cancel()
+        finally:
+            writer.close()
+
+    def stats(self):
+        latencies = sorted(self.latencies)
+        return {
+            "uptime_seconds": round(time.time() - self.started, 3),
+            "workers": self.workers,
+            "max_pending": self.max_pending,
+            "in_flight": len(self.in_flight),
+            "queued": max(0, len(self.in_flight) + len(self.abandoned) - self.workers),
+            "abandoned": len(self.abandoned),
+            "waiting": sum(entry[1] for entry in self.in_flight.values()),
+            "counts": dict(self.counts),
+            "latency_ms": {name: percentile(latencies, fraction) for name, fraction in (("p50", 0.5), ("p90", 0.9), ("p99", 0.99), ("max", 1.0))},
+            "latency_samples": len(latencies),
+        }
+
+
+class ServiceBusy(Exception):
+    pass
+
+
+def utility(request):
+    sequence = request["sequence"]
+    if "booster_index" in request or "multiplier" in request:
+        calculator = UtilityWithBooster(request["target"], request["weights"], request.get("booster_index"), request.get("multiplier", 1.0), request.get("matrix"))
+    else:
+        calculator = UtilityCalculator(request["target"], request["weights"], request.get("matrix"))
+    return calculator.calculate(sequence)
+
+# Nearest-rank percentile of sorted seconds, in milliseconds.
+def percentile(latencies, fraction):
+    if not latencies:
+        return None
+    index = max(0, min(len(latencies) - 1, int(round(fraction * len(latencies))) - 1))
+    return round(latencies[index] * 1000, 3)
+
+
+async def serve(service, address, ready = None):
+    service.start()
+    if address.startswith("unix:"):
+        path = address[len("unix:"):]
+        if os.path.exists(path):
+            os.unlink(path)
+        server = await asyncio.start_unix_server(service.serve_connection, path = path, limit = 1 << 24)
+    else:
+        host, port = address.rsplit(":", 1)
+        server = await asyncio.start_server(service.serve_connection, host or "127.0.0.1", int(port), limit = 1 << 24)
+    if ready is not None:
+        ready(server)
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        service.close()
+        if address.startswith("unix:") and os.path.exists(path):
+            os.unlink(path)
+
+def run_service(address, workers = None, max_pending = 64, timeout = None, cache = None):
+    service = SolveService(workers, max_pending, timeout, cache)
+    try:
+        asyncio.run(serve(service, address))
+    except KeyboardInterrupt:
+        pass
+
+# Sends each message to a running service over one connection and returns the
+# responses in the order they arrive.
+async def request(address, *messages):
+    if address.startswith("unix:"):
+        reader, writer = await asyncio.open_unix_connection(address[len("unix:"):], limit = 1 << 24)
+    else:
+        host, port = address.rsplit(":", 1)
+        reader, writer = await asyncio.open_connection(host or "127.0.0.1", int(port), limit = 1 << 24)
+    try:
+        for message in messages:
+            writer.write(json.dumps(message).encode() + b"\n")
+        await writer.drain()
+        responses = []
+        for _ in messages:
+            line = await reader.readline()
+            if not line:
+                break
+            responses.append(json.loads(line))
+        return responses
+    finally:
+        writer.close()
@@ -0,0 +1,136 @@
+import time
+
+##################### Search Stats #####################
+
+# Opt-in counters for SearchEngine, one object per solver. The engine only touches
+# it behind `if stats is not None`, so a solver without stats pays one comparison
+# per node. Depth d counts nodes with d symbols placed; leaves sit at depth
+# len(pool). A node whose last plies were resolved as one leaf batch counts as a
+# leaf batch at its own depth; the leaves inside it are not counted. Depth times
+# are inclusive of the subtree, and scoring time covers leaf scores, leaf batches
+# and re-scoring transposition table lines.
+class SearchStats:
+    def __init__(self, profile = False):
+        self.profile = profile
+        self.profile_report = None
+        self.solves = 0
+        self.nodes = []
+        self.leaves = []
+        self.leaf_batches = []
+        self.transposition_hits = []
+        self.cutoffs = []
+        self.bound_cutoffs = []
+        self.cutoff_moves = {}
+        self.depth_seconds = []
+        self.scoring_seconds = 0.0
+        self.search_seconds = 0.0
+        self.started = []
+
+    def reserve(self, depth):
+        while len(self.nodes) <= depth:
+            self.nodes.append(0)
+            self.leaves.append(0)
+            self.leaf_batches.append(0)
+            self.transposition_hits.append(0)
+            self.cutoffs.append(0)
+            self.bound_cutoffs.append(0)
+            self.depth_seconds.append(0.0)
+            self.started.append(0.0)
+
+    def enter(self, depth):
+        self.nodes[depth] += 1
+        self.started[depth] = time.perf_counter()
+
+    def leave(self, depth):
+        self.depth_seconds[depth] += time.perf_counter() - self.started[depth]
+
+    def leaf(self, depth, seconds):
+        self.nodes[depth] += 1
+        self.leaves[depth] += 1
+        self.scoring_seconds += seconds
+
+    def leaf_batch(self, depth, seconds):
+        self.leaf_batches[depth] += 1
+        self.scoring_seconds += seconds
+
+    def transposition_hit(self, depth, seconds):
+        self.transposition_hits[depth] += 1
+        self.scoring_seconds += seconds
+
+    def bound_cutoff(self, depth):
+        self.bound_cutoffs[depth] += 1
+
+    def cutoff(self, depth, move_number):
+        self.cutoffs[depth] += 1
+        self.cutoff_moves[move_number] = self.cutoff_moves.get(move_number, 0) + 1
+
+    # Wraps one solve: times it and, with profile = True, runs it under cProfile
+    # and keeps the busiest functions as text.
+    def measure(self, solve):
+        self.solves += 1
+        started = time.perf_counter()
+        if self.profile:
+            import cProfile
+            import io
+            import pstats
+            profiler = cProfile.Profile()
+            result = profiler.runcall(solve)
+            report = io.StringIO()
+            pstats.Stats(profiler, stream = report).sort_stats("cumulative").print_stats(20)
+            self.profile_report = report.getvalue()
+        else:
+            result = solve()
+        self.search_seconds += time.perf_counter() - started
+        return result
+
+    def merge(self, other):
+        self.reserve(len(other.nodes) - 1)
+        for depth in range(len(other.nodes)):
+            self.nodes[depth] += other.nodes[depth]
+            self.leaves[depth] += other.leaves[depth]
+            self.leaf_batches[depth] += other.leaf_batches[depth]
+            self.transposition_hits[depth] += other.transposition_hits[depth]
+            self.cutoffs[depth] += other.cutoffs[depth]
+            self.bound_cutoffs[depth] += other.bound_cutoffs[depth]
+            self.depth_seconds[depth] += other.depth_seconds[depth]
+        for move_number, count in other.cutoff_moves.items():
+            self.cutoff_moves[move_number] = self.cutoff_moves.get(move_number, 0) + count
+        self.scoring_seconds += other.scoring_seconds
+
+    # Nodes at depth d + 1 per node expanded at depth d.
+    def branching_factors(self):
+        factors = []
+        for depth in range(len(self.nodes) - 1):
+            expanded = self.nodes[depth] - self.leaves[depth] - self.leaf_batches[depth] - self.transposition_hits[depth] - self.bound_cutoffs[depth]
+            factors.append(round(self.nodes[depth + 1] / expanded, 4) if expanded > 0 else None)
+        return factors
+
+    # The uniform branching factor b with b ** depth = leaves.
+    def effective_branching_factor(self):
+        depth = len(self.nodes) - 1
+        if depth <= 0 or self.leaves[depth] == 0:
+            return None
+        return round(self.leaves[depth] ** (1 / depth), 4)
+
+    def as_dict(self):
+        return {
+            "solves": self.solves,
+            "nodes": sum(self.nodes),
+            "nodes_per_depth": self.nodes,
+            "leaves_per_depth": self.leaves,
+            "leaf_batches_per_depth": self.leaf_batches,
+            "transposition_hits_per_depth": self.transposition_hits,
+            "cutoffs_per_depth": self.cutoffs,
+            "bound_cutoffs_per_depth": self.bound_cutoffs,
+            "cutoff_move_numbers": {str(move_number): self.cutoff_moves[move_number] for move_number in sorted(self.cutoff_moves)},
+            "branching_factors": self.branching_factors(),
+            "effective_branching_factor": self.effective_branching_factor(),
+            "seconds_per_depth": [round(seconds, 6) for seconds in self.depth_seconds],
+            "scoring_seconds": round(self.scoring_seconds, 6),
+            "search_seconds": round(self.search_seconds - self.scoring_seconds, 6),
+            "profile": self.profile_report,
+        }
+
+    def to_json(self):
+        import json
+        return json.dumps(self.as_dict())
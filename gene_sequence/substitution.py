@@ -0,0 +1,103 @@
+import json
+
+##################### Substitution Matrices #####################
+
+# What placing one symbol against a target symbol costs, before the position
+# weight. Symbols are byte codes and 0 stands for a position one of the two
+# sequences does not reach, so the gap cost for a length mismatch is the cost
+# against 0. row(target) compiles one dense row of 256 costs indexed by the
+# placed symbol's code; rows are built on first use and kept.
+class SubstitutionMatrix:
+    def __init__(self, pairs = None, default = 1, gap = 1, match = 0, symmetric = True, name = None):
+        self.default = default
+        self.gap = gap
+        self.match = match
+        self.symmetric = symmetric
+        self.name = name
+        self.pairs = {}
+        for pair, cost in (pairs or {}).items():
+            gene, target = pair
+            self.pairs[(ord(gene), ord(target))] = cost
+            if symmetric:
+                self.pairs.setdefault((ord(target), ord(gene)), cost)
+        self.rows = {}
+
+    def pair_cost(self, gene, target):
+        if gene == 0 or target == 0:
+            return 0 if gene == target else self.gap
+        cost = self.pairs.get((gene, target))
+        if cost is None:
+            return self.match if gene == target else self.default
+        return cost
+
+    def row(self, target):
+        row = self.rows.get(target)
+        if row is None:
+            row = [self.pair_cost(gene, target) for gene in range(256)]
+            self.rows[target] = row
+        return row
+
+    def cost(self, gene_symbol, target_symbol):
+        return self.row(ord(target_symbol) if target_symbol else 0)[ord(gene_symbol) if gene_symbol else 0]
+
+    # A JSON-able description; equal specs score identically.
+    def spec(self):
+        if self.name is not None:
+            return self.name
+        pairs = {chr(gene) + chr(target): cost for (gene, target), cost in sorted(self.pairs.items())}
+        return {"pairs": pairs, "default": self.default, "gap": self.gap, "match": self.match, "symmetric": False}
+
+    # Compared as JSON, which tells a cost of 1 from 1.0: they score differently.
+    def __eq__(self, other):
+        if not isinstance(other, SubstitutionMatrix):
+            return NotImplemented
+        return self.key() == other.key()
+
+    def __hash__(self):
+        return hash(self.key())
+
+    def key(self):
+        return json.dumps(self.spec(), sort_keys = True)
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        state["rows"] = {}
+        return state
+
+
+# The original scoring: the distance between the two character codes, so a gap
+# costs the code of the symbol that is there.
+class OrdinalDifference(SubstitutionMatrix):
+    def __init__(self):
+        super().__init__(name = "ord")
+
+    def pair_cost(self, gene, target):
+        return abs(gene - target)
+
+
+ORDINAL_DIFFERENCE = OrdinalDifference()
+
+# Transitions (A<->G, C<->T) are likelier than transversions. Other symbols, e.g.
+# the booster "S", cost as much as a transversion.
+TRANSITION_TRANSVERSION = SubstitutionMatrix({"AG": 1, "CT": 1}, default = 2, gap = 4, name = "transition-transversion")
+
+PRESETS = {matrix.name: matrix for matrix in (ORDINAL_DIFFERENCE, TRANSITION_TRANSVERSION)}
+
+# None, a preset name, a SubstitutionMatrix, or a dict of SubstitutionMatrix
+# arguments such as {"pairs": {"AG": 1, "CT": 1}, "default": 2, "gap": 4} (what
+# batch jobs and the command line pass).
+def substitution_matrix(spec):
+    if spec is None:
+        return ORDINAL_DIFFERENCE
+    if isinstance(spec, SubstitutionMatrix):
+        return spec
+    if isinstance(spec, str):
+        if spec in PRESETS:
+            return PRESETS[spec]
+        try:
+            spec = json.loads(spec)
+        except ValueError:
+            pass
+    if not isinstance(spec, dict):
+        raise ValueError(f"unknown substitution matrix {spec!r} (presets: {', '.join(sorted(PRESETS))})")
+    return SubstitutionMatrix(**spec)
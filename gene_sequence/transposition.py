@@ -0,0 +1,69 @@
+from collections import OrderedDict
+
+##################### Transposition Table #####################
+
+EXACT = 0
+LOWER_BOUND = 1
+UPPER_BOUND = 2
+
+# packed = True keeps each line as an int of 2 or 3 bits per symbol instead of a
+# str, for large tables where memory matters more than the time spent packing.
+class TranspositionTable:
+    def __init__(self, max_entries = 1_000_000, packed = False):
+        self.max_entries = max_entries
+        self.packed = packed
+        self.entries = OrderedDict()
+        self.probes = 0
+        self.hits = 0
+        self.stores = 0
+        self.evictions = 0
+
+    def probe(self, key):
+        self.probes += 1
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.hits += 1
+            self.entries.move_to_end(key)
+        return entry
+
+    def store(self, key, flag, line):
+        if self.max_entries <= 0:
+            return
+        if key in self.entries:
+            self.entries.move_to_end(key)
+        elif len(self.entries) >= self.max_entries:
+            self.entries.popitem(last = False)
+            self.evictions += 1
+        self.entries[key] = (flag, line)
+        self.stores += 1
+
+    def hit_rate(self):
+        if self.probes == 0:
+            return 0.0
+        return self.hits / self.probes
+
+    def clear(self):
+        self.entries.clear()
+        self.probes = 0
+        self.hits = 0
+        self.stores = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+
+def bound_flag(score, alpha, beta):
+    if score <= alpha:
+        return UPPER_BOUND
+    if score >= beta:
+        return LOWER_BOUND
+    return EXACT
+
+
+def usable_entry(flag, score, alpha, beta):
+    if flag == EXACT:
+        return True
+    if flag == LOWER_BOUND:
+        return score >= beta
+    return score <= alpha
@@ -0,0 +1,78 @@
+import heapq
+import math
+
+##################### Principal Variations #####################
+
+# Yields (score, sequence) in non-increasing score order, lazily. The maximizer's
+# moves are ranked, while the minimizer always answers with a move that keeps the
+# minimax value of its node. So the lines are the optimal line, then every line
+# where the maximizer gives something up somewhere, best first. Equal scores come
+# in pool order, so the first result is the one solve() returns, found by the same
+# search.
+#
+# A sibling is only searched when its upper bound reaches the top of its parent's
+# queue, and every search goes through `engine`'s transposition table, so asking
+# for k results costs far less than k searches. Stops after `max_results` results
+# or at the first score below `floor`.
+PENDING = 0
+STREAM = 1
+
+def principal_variations(engine, max_results = None, floor = None):
+    if max_results is not None and max_results <= 0:
+        return
+    value, line = engine.search()
+    count = 0
+    for value, line in ranked_lines(engine, (), value, line):
+        if floor is not None and value < floor:
+            return
+        yield value, line
+        count += 1
+        if max_results is not None and count >= max_results:
+            return
+
+# The lines below the node reached by `prefix`, given its minimax value and its
+# line (which is yielded first). Queue entries are (-score, pool index, kind, ...):
+# PENDING for a sibling not searched yet, keyed by the node's value as its bound,
+# and STREAM for a searched child, keyed by the next line it will give.
+def ranked_lines(engine, prefix, value, line):
+    yield value, line
+    depth = len(prefix)
+    if depth == len(engine.pool):
+        return
+    pool = engine.pool
+    maximizing = depth % 2 == 0
+    queue = []
+    chosen = None
+    for i in engine.candidates(prefix):
+        if chosen is None and pool[i] == line[depth]:
+            chosen = i
+            child = ranked_lines(engine, prefix + (i,), value, line)
+            next(child)
+            push_next(queue, i, child)
+        else:
+            queue.append((-value, i, PENDING))
+    heapq.heapify(queue)
+
+    while queue:
+        entry = heapq.heappop(queue)
+        i = entry[1]
+        if entry[2] == STREAM:
+            yield -entry[0], entry[4]
+            push_next(queue, i, entry[3])
+            continue
+        prefix_child = prefix + (i,)
+        if maximizing:
+            child_value, child_line = engine.search(prefix_child)
+        else:
+            # Only replies that keep the node's value: search just around it.
+            child_value, child_line = engine.search(prefix_child, math.nextafter(value, float('-inf')), math.nextafter(value, float('inf')))
+            if not engine.exact:
+                continue
+        lines = ranked_lines(engine, prefix_child, child_value, child_line)
+        next(lines)
+        heapq.heappush(queue, (-child_value, i, STREAM, lines, child_line))
+
+def push_next(queue, i, lines):
+    following = next(lines, None)
+    if following is not None:
+        heapq.heappush(queue, (-following[0], i, STREAM, lines, following[1]))
@@ -0,0 +1,155 @@
+from .batch_scoring import batch_utility, candidate_matrix
+from .cost_table import cached_cost_table
+from .engine import SearchEngine
+from .monte_carlo import MonteCarloSolver
+from .ordering import MoveOrdering
+from .stats import SearchStats
+from .substitution import substitution_matrix
+from .transposition import TranspositionTable
+
+##################### Without Booster #####################
+
+class UtilityCalculator:
+    def __init__(self, target_sequence, weights, matrix = None):
+        self.target_sequence = target_sequence
+        self.weights = weights
+        self.matrix = substitution_matrix(matrix)
+        self.positions = []
+
+    # (weight, costs by gene symbol code) per position, compiled on first use.
+    def position_costs(self, length):
+        for i in range(len(self.positions), length):
+            target_character = ord(self.target_sequence[i]) if i < len(self.target_sequence) else 0
+            weight = self.weights[i] if i < len(self.weights) else 1
+            self.positions.append((weight, self.matrix.row(target_character)))
+        return self.positions
+
+    def calculate(self, gene_sequence):
+        try:
+            codes = gene_sequence.encode("latin-1")
+        except (AttributeError, UnicodeEncodeError):
+            # Lists of symbols, or symbols past the compiled rows.
+            return self.calculate_symbols(gene_sequence)
+        positions = self.position_costs(max(len(codes), len(self.target_sequence)))
+        utility = 0
+        for (weight, costs), code in zip(positions, codes):
+            utility -= weight * costs[code]
+        for weight, costs in positions[len(codes):len(self.target_sequence)]:
+            utility -= weight * costs[0]
+        return utility
+
+    def calculate_symbols(self, gene_sequence):
+        utility = 0
+        for i in range(max(len(gene_sequence), len(self.target_sequence))):
+            gene_character = ord(gene_sequence[i]) if i < len(gene_sequence) else 0
+            target_character = ord(self.target_sequence[i]) if i < len(self.target_sequence) else 0
+            weight = self.weights[i] if i < len(self.weights) else 1
+            utility -= weight * self.matrix.pair_cost(gene_character, target_character)
+        return utility
+
+    def calculate_batch(self, candidates):
+        codes = candidate_matrix(candidates, len(self.target_sequence))
+        weights = [self.weights[i] if i < len(self.weights) else 1 for i in range(codes.shape[1])]
+        return batch_utility(codes, self.target_sequence, weights, matrix = self.matrix)
+
+    def cost_table(self, length, symbols):
+        return cached_cost_table(self.target_sequence, tuple(self.weights), length, tuple(sorted(symbols)), matrix = self.matrix)
+    
+class AlphaBetaPruning:
+    def __init__(self, pool, utility_calculator, transposition_table = None, move_ordering = None, workers = 1, split_depth = 1, stats = None, bound_pruning = False,
+                 leaf_batch = 0):
+        self.initial_pool = pool
+        self.utility_calculator = utility_calculator
+        if transposition_table is None:
+            transposition_table = TranspositionTable()
+        self.transposition_table = transposition_table
+        if move_ordering is None:
+            move_ordering = MoveOrdering()
+        self.move_ordering = move_ordering
+        self.workers = workers
+        self.split_depth = split_depth
+        self.stats = stats
+        self.bound_pruning = bound_pruning
+        self.leaf_batch = leaf_batch
+        self.cost_table = None
+        self.engine = None
+        self.nodes = 0
+        self.bound_cutoffs = 0
+
+    def prepare(self):
+        if self.cost_table is None:
+            self.cost_table = self.utility_calculator.cost_table(len(self.initial_pool), set(self.initial_pool))
+            self.engine = SearchEngine(self.initial_pool, self.cost_table, False, self.transposition_table, self.move_ordering, self.stats, self.bound_pruning,
+                                       self.leaf_batch)
+        return self.engine
+
+    def solve(self):
+        self.prepare()
+        self.move_ordering.reset_counters()
+        if self.workers != 1:
+            from .parallel import ParallelSearch
+            search = ParallelSearch(self.engine, self.workers, self.split_depth)
+        else:
+            search = self.engine
+        if self.stats is not None:
+            result = self.stats.measure(search.search)
+        else:
+            result = search.search()
+        self.nodes = search.nodes
+        self.bound_cutoffs = search.bound_cutoffs
+        return result
+
+    # Lazily yields (score, sequence) from the optimal line down, sharing the search
+    # and its transposition table with solve(); see variations.py.
+    def variations(self, max_results = None, floor = None):
+        from .variations import principal_variations
+        return principal_variations(self.prepare(), max_results, floor)
+        
+# With a time_limit or node_limit the game is played by MonteCarloSolver instead.
+# stats = True attaches a SearchStats to the exact solver; profile = True also runs
+# the solve under cProfile. `cache` is a ResultCache consulted by exact solves
+# without stats; verify_cache = True solves cache hits again to check them.
+# `matrix` is a SubstitutionMatrix or anything substitution_matrix() accepts.
+class GeneSequence:
+    def __init__(self, pool, target, weights, workers = 1, time_limit = None, node_limit = None, seed = None, stats = False, profile = False,
+                 cache = None, verify_cache = False, matrix = None):
+        self.pool = pool
+        self.target = target
+        self.weights = weights[-len(target):]
+        self.matrix = substitution_matrix(matrix)
+        self.utility_calculator = UtilityCalculator(target, self.weights, self.matrix)
+        if time_limit is None and node_limit is None:
+            search_stats = SearchStats(profile) if stats or profile else None
+            self.solver = AlphaBetaPruning(pool, self.utility_calculator, workers = workers, stats = search_stats)
+        else:
+            self.solver = MonteCarloSolver(pool, self.utility_calculator, time_limit = time_limit, node_limit = node_limit, seed = seed)
+        self.cache = cache if isinstance(self.solver, AlphaBetaPruning) and self.solver.stats is None else None
+        self.verify_cache = verify_cache
+        self.cached = False
+
+    def solve(self):
+        if self.cache is None:
+            return self.solver.solve()
+        key = self.cache.fingerprint("without_booster", self.pool, self.target, self.weights, matrix = self.matrix)
+        result, self.cached = self.cache.fetch(key, self.search, lambda result: result["score"], self.verify_cache)
+        if self.cached and not self.verify_cache:
+            self.solver.nodes = 0
+        return result["score"], result["best_sequence"]
+
+    def search(self):
+        score, best_sequence = self.solver.solve()
+        return {"score": score, "best_sequence": best_sequence}
+
+    def run(self):
+        utility_score, best_sequence = self.solve()
+        print(f"Best gene sequence generated: {best_sequence}")
+        print(f"Utility score: {utility_score}")
+        return utility_score, best_sequence
+        
+
+# Sample Input W/O Booster
+# pool = ["A", "T", "C", "G"]
+# target = "GCAT"
+# weights = [2, 3, 1, 8, 8, 8, 1, 1]
+# game = GeneSequence(pool, target, weights)
+# game.run()
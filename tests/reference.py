@@ -0,0 +1,167 @@
+##################### Reference Solvers #####################
+
+# The recursive solvers from the original ai-gene-sequence-generator.py, kept
+# as they were so the tests can compare every search option against them.
+
+class UtilityCalculator:
+    def __init__(self, target_sequence, weights):
+        self.target_sequence = target_sequence
+        self.weights = weights
+
+    def calculate(self, gene_sequence):
+        utility = 0
+        maximum_length = max(len(gene_sequence), len(self.target_sequence))
+
+        for i in range(maximum_length):
+            if i < len(gene_sequence):
+                gene_character = ord(gene_sequence[i])
+            else:
+                gene_character = 0
+
+            if i < len(self.target_sequence):
+                target_character = ord(self.target_sequence[i])
+            else:
+                target_character = 0
+
+            if i < len(self.weights):
+                weight = self.weights[i]
+            else:
+                weight = 1
+
+            utility -= weight * abs(gene_character - target_character)
+
+        return utility
+
+class AlphaBetaPruning:
+    def __init__(self, pool, utility_calculator):
+        self.initial_pool = pool
+        self.utility_calculator = utility_calculator
+
+    def solve(self):
+        return self._alpha_beta("", self.initial_pool, True, float('-inf'), float('inf'))
+
+    def _alpha_beta(self, sequence, pool, maximizing, alpha, beta):
+        if not pool:
+            return self.utility_calculator.calculate(sequence), sequence
+
+        if maximizing == True:
+            max_eval = float('-inf')
+            best_sequence = None
+            for i in range(len(pool)):
+                nucleotide = pool[i]
+                new_sequence = sequence + nucleotide
+                new_pool = pool[:i] + pool[i + 1:]
+                eval_score, candidate_sequence = self._alpha_beta(new_sequence, new_pool, False, alpha, beta)
+
+                if eval_score > max_eval:
+                    max_eval = eval_score
+                    best_sequence = candidate_sequence
+                alpha = max(alpha, max_eval)
+
+                if alpha >= beta:
+                    break
+
+            return max_eval, best_sequence
+
+        else:
+            min_eval = float('inf')
+            best_sequence = None
+            for i in range(len(pool)):
+                nucleotide = pool[i]
+                new_sequence = sequence + nucleotide
+                new_pool = pool[:i] + pool[i + 1:]
+                eval_score, candidate_sequence = self._alpha_beta(new_sequence, new_pool, True, alpha, beta)
+
+                if eval_score < min_eval:
+                    min_eval = eval_score
+                    best_sequence = candidate_sequence
+                beta = min(beta, min_eval)
+
+                if beta <= alpha:
+                    break
+            return min_eval, best_sequence
+
+class UtilityWithBooster:
+    def __init__(self, target_sequence, weights, booster_index = None, multiplier = 1.0):
+        self.target_sequence = target_sequence
+        self.weights = weights
+        self.booster_index = booster_index
+        self.multiplier = multiplier
+
+    def calculate(self, gene_sequence):
+        total_utility = 0
+        loop_range = max(len(gene_sequence), len(self.target_sequence))
+
+        for i in range(loop_range):
+            gene_char = ord(gene_sequence[i]) if i < len(gene_sequence) else 0
+            target_char = ord(self.target_sequence[i]) if i < len(self.target_sequence) else 0
+            if i < len(self.weights):
+                weight = self.weights[i]
+                if self.booster_index is not None and i >= self.booster_index:
+                    weight *= self.multiplier
+            else:
+                weight = 1
+
+            total_utility -= weight * abs(gene_char - target_char)
+
+        return round(total_utility, 2)
+
+class BoosterAlphaBeta:
+    def __init__(self, pool, utility_object, booster_enabled = False):
+        self.pool = pool
+        self.utility_object = utility_object
+        self.booster_enabled = booster_enabled
+
+    def run_solver(self):
+        return self._minimax("", self.pool, True, float("-inf"), float("inf"), booster_triggered = False)
+
+    def _minimax(self, current_sequence, remaining_pool, maximizing_player, alpha, beta, booster_triggered):
+        if not remaining_pool:
+            if booster_triggered == True:
+                booster_index = current_sequence.index("S")
+            else:
+                booster_index = None
+            calculator = UtilityWithBooster(self.utility_object.target_sequence, self.utility_object.weights, booster_index, self.utility_object.multiplier)
+
+            return calculator.calculate(current_sequence), current_sequence
+
+        if maximizing_player:
+            max_value = float('-inf')
+            best_seq = ""
+            for i in range(len(remaining_pool)):
+                nucleotide = remaining_pool[i]
+                new_sequence = current_sequence + nucleotide
+                new_pool = remaining_pool[:i] + remaining_pool[i + 1:]
+                is_boosted = booster_triggered or (self.booster_enabled and nucleotide == "S")
+                eval_score, eval_sequence = self._minimax(new_sequence, new_pool, False, alpha, beta, is_boosted)
+
+                if eval_score > max_value:
+                    max_value = eval_score
+                    best_seq = eval_sequence
+
+                alpha = max(alpha, eval_score)
+
+                if alpha >= beta:
+                    break
+
+            return max_value, best_seq
+
+        else:
+            min_value = float('inf')
+            best_seq = ""
+            for i in range(len(remaining_pool)):
+                nucleotide = remaining_pool[i]
+                new_sequence = current_sequence + nucleotide
+                new_pool = remaining_pool[:i] + remaining_pool[i + 1:]
+                eval_score, eval_sequence = self._minimax(new_sequence, new_pool, True, alpha, beta, booster_triggered)
+
+                if eval_score < min_value:
+                    min_value = eval_score
+                    best_seq = eval_sequence
+
+                beta = min(beta, eval_score)
+
+                if beta <= alpha:
+                    break
+
+            return min_value, best_seq
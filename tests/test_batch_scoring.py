@@ -0,0 +1,33 @@
+import random
+
+import pytest
+
+from gene_sequence import UtilityCalculator, UtilityWithBooster
+
+np = pytest.importorskip("numpy")
+
+# calculate_batch() must give exactly what calculate() gives for each candidate,
+# float sums and the booster's rounding included, for lists of strings and for
+# uint8 arrays (rows padded with 0 where a candidate ends).
+def calculators(rng):
+    for _ in range(60):
+        target = "".join(rng.choice("ATGCS") for _ in range(rng.randint(0, 8)))
+        weights = [rng.choice([rng.randint(-3, 9), round(rng.uniform(-2, 9), rng.choice([1, 2, 3])), rng.random()]) for _ in range(rng.randint(0, 10))]
+        yield UtilityCalculator(target, weights)
+        booster_index = rng.choice([None, rng.randint(0, 8)])
+        yield UtilityWithBooster(target, weights, booster_index, rng.choice([1.0, 0.23, 0.5, 1.7, 2]))
+
+def as_array(candidates):
+    codes = np.zeros((len(candidates), max(len(candidate) for candidate in candidates)), dtype = np.uint8)
+    for row, candidate in enumerate(candidates):
+        codes[row, :len(candidate)] = list(candidate.encode("latin-1"))
+    return codes
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_batch_scores_match_calculate(seed):
+    rng = random.Random(seed)
+    for calculator in calculators(rng):
+        candidates = ["".join(rng.choice("ATGCS") for _ in range(rng.randint(0, 10))) for _ in range(rng.randint(1, 12))]
+        expected = [calculator.calculate(candidate) for candidate in candidates]
+        for batch in (calculator.calculate_batch(candidates), calculator.calculate_batch(as_array(candidates))):
+            assert batch.tolist() == expected
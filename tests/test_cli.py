@@ -0,0 +1,17 @@
+from gene_sequence import booster, cli
+
+# --workers reaches a single booster solve, which returns what a serial one does.
+def test_workers_reach_a_single_booster_solve(monkeypatch, capsys):
+    seen = []
+    analyse = booster.GeneBoosterRunner.analyse
+
+    def recording(runner):
+        seen.append(runner.workers)
+        return analyse(runner)
+    monkeypatch.setattr(booster.GeneBoosterRunner, "analyse", recording)
+    outputs = []
+    for workers in ("1", "2"):
+        cli.main(["--pool", "SATGCA", "--target", "GCAT", "--weights", "2", "3", "1", "8", "8", "8", "1", "1", "--booster", "--workers", workers])
+        outputs.append(capsys.readouterr().out)
+    assert seen == [1, 2]
+    assert outputs[0] == outputs[1]
@@ -0,0 +1,33 @@
+from gene_sequence import CostTable, GeneSequence, GeneBoosterRunner, SubstitutionMatrix, UtilityCalculator
+
+import reference
+
+# 1 and 1.0 hash alike, but a table built for one must not answer for the other:
+# the score's type follows the weights', as calculate() gives it.
+def test_int_weights_after_float_weights():
+    for weights in ([8.0, 8.0, 1.0, 1.0], [8, 8, 1, 1], [8.0, 8.0, 1.0, 1.0]):
+        score, best_sequence = GeneSequence(list("ATCG"), "GCAT", weights).solve()
+        expected = reference.AlphaBetaPruning(list("ATCG"), reference.UtilityCalculator("GCAT", weights)).solve()
+        assert repr(score) == repr(expected[0]) and best_sequence == expected[1]
+        assert repr(score) == repr(UtilityCalculator("GCAT", weights).calculate(best_sequence))
+
+# The maximizer opens with "S" here, so the boosted rows are used.
+def test_int_multiplier_after_float_multiplier():
+    scores = []
+    for multiplier in (1.0, 1, 1.0):
+        result = GeneBoosterRunner(list("SATC"), "SCAT", [8, 8, 1, 1], multiplier = multiplier).analyse()
+        scores.append(repr(result["with_s"]["score"]))
+    expected = reference.BoosterAlphaBeta(list("SATC"), reference.UtilityWithBooster("SCAT", [8, 8, 1, 1], multiplier = 1), True).run_solver()
+    assert scores[1] == repr(expected[0])
+    assert scores[0] == scores[2] != scores[1]
+
+def test_matrices_with_int_and_float_costs_differ():
+    assert SubstitutionMatrix({"AC": 1}) != SubstitutionMatrix({"AC": 1.0})
+    assert SubstitutionMatrix({"AC": 1}) == SubstitutionMatrix({"AC": 1})
+
+def test_cost_types():
+    table = CostTable("GCAT", [8, 8, 1, 1], 4, "ATGCS", multiplier = 0.23)
+    assert table.int_costs and not table.boosted_int_costs and table.fits_float64
+    assert CostTable("GCAT", [8, 8, 1, 1], 4, "ATGCS", multiplier = 2).boosted_int_costs
+    assert not CostTable("GCAT", [8, 0.5], 4, "ATGC").int_costs
+    assert not CostTable("GCAT", [2 ** 50, 1], 4, "ATGC").fits_float64
@@ -0,0 +1,65 @@
+import random
+
+import pytest
+
+import gene_sequence
+import reference
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+needs_numpy = pytest.mark.skipif(numpy is None, reason = "leaf batches need NumPy")
+
+# Seeded random instances, each solved by the engine with one set of options and
+# by the recursive reference solvers. Score and line must match exactly, ties
+# included: pools repeat symbols, weights mix ints and floats (some negative),
+# and booster multipliers are floats, so the booster's rounding is exercised too.
+
+OPTIONS = [
+    {},
+    {"bound_pruning": True},
+    pytest.param({"leaf_batch": 3}, marks = needs_numpy),
+    {"transposition_table": "packed"},
+]
+
+def instances(seed, count, max_pool):
+    rng = random.Random(seed)
+    for _ in range(count):
+        alphabet = rng.choice(["ATGCS", "ATS", "AS", "AC", "ATGC"])
+        pool = [rng.choice(alphabet) for _ in range(rng.randint(1, max_pool))]
+        # Empty targets score the symbols themselves, which makes for many ties.
+        target = "".join(rng.choice("ATGC") for _ in range(rng.choice([0, rng.randint(1, max_pool + 1)])))
+        weights = [rng.choice([rng.randint(-1, 8), rng.choice([0.1, 0.3, 0.7, 1.5, 2.25])]) for _ in range(rng.randint(0, max_pool + 2))]
+        multiplier = rng.choice([1.0, 0.23, 0.3, 0.7, 1.1])
+        yield pool, target, weights, multiplier
+
+def engine_options(options):
+    options = dict(options)
+    if options.get("transposition_table") == "packed":
+        options["transposition_table"] = gene_sequence.TranspositionTable(packed = True)
+    return options
+
+def check(seed, count, max_pool, options):
+    for pool, target, weights, multiplier in instances(seed, count, max_pool):
+        expected = reference.AlphaBetaPruning(list(pool), reference.UtilityCalculator(target, weights)).solve()
+        solver = gene_sequence.AlphaBetaPruning(list(pool), gene_sequence.UtilityCalculator(target, weights), **engine_options(options))
+        assert solver.solve() == expected, (pool, target, weights)
+
+        for booster_enabled in (True, False):
+            expected = reference.BoosterAlphaBeta(list(pool), reference.UtilityWithBooster(target, weights, multiplier = multiplier), booster_enabled).run_solver()
+            utility = gene_sequence.UtilityWithBooster(target, weights, multiplier = multiplier)
+            solver = gene_sequence.BoosterAlphaBeta(list(pool), utility, booster_enabled, **engine_options(options))
+            assert solver.run_solver() == expected, (pool, target, weights, multiplier, booster_enabled)
+
+@pytest.mark.parametrize("options", OPTIONS, ids = lambda options: ",".join(options) or "default")
+@pytest.mark.parametrize("seed, count, max_pool", [(5, 150, 6), (6, 150, 6), (7, 40, 8)])
+def test_engine_matches_recursive_solvers(seed, count, max_pool, options):
+    check(seed, count, max_pool, options)
+
+# The pool is split across processes below the root; fewer instances, as each
+# solve starts a pool.
+@pytest.mark.parametrize("options", [{}, pytest.param({"bound_pruning": True, "leaf_batch": 3}, marks = needs_numpy)], ids = ["default", "bounds,leaf_batch"])
+def test_parallel_engine_matches_recursive_solvers(options):
+    check(3, 8, 7, dict(options, workers = 2, split_depth = 2))
@@ -0,0 +1,16 @@
+from gene_sequence import AlphaBetaPruning, BoosterAlphaBeta, UtilityCalculator, UtilityWithBooster
+
+
+# A line found below one prefix only keeps its rank below another when the costs
+# are ints; with this multiplier two lines tie under one prefix and not another.
+def test_float_costs_do_not_reuse_lines_across_prefixes():
+    pool = ['A', 'S', 'A', 'S', 'S', 'A', 'A', 'A']
+    utility = UtilityWithBooster('', [1, 0.3, 8, 1, -1, 1, 8, 8, -1], multiplier = 0.23)
+    assert BoosterAlphaBeta(pool, utility, True).run_solver() == (-426.3, 'SAAASAAS')
+
+
+# Move ordering searches moves out of pool order, but on a tie the first line in
+# pool order must still win, including when it comes from the table.
+def test_move_ordering_keeps_pool_order_ties_with_the_table():
+    utility = UtilityCalculator('G', [0, 0.3, 1, 1.5, 0.3, 0.3, 1.5, 1.5])
+    assert AlphaBetaPruning(['S', 'A', 'T', 'S', 'A', 'T'], utility).solve() == (-260.3, 'TSATSA')
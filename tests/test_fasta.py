@@ -0,0 +1,74 @@
+import random
+
+import pytest
+
+from gene_sequence import FastaReader, sliding_windows
+
+# Records as a whole-file parse gives them: (name, residues), with residues
+# before the first header in an unnamed record.
+def parse(text):
+    records = []
+    for line in text.replace("\r\n", "\n").split("\n"):
+        residues = "".join(line.split()).upper()
+        if line.startswith(">"):
+            records.append((line[1:].strip(), ""))
+        elif residues:
+            name, sequence = records.pop() if records else ("", "")
+            records.append((name, sequence + residues))
+    return records
+
+def fasta_texts(rng):
+    yield ">one\nACGT\nacgt\n>two words\r\nAC GT\r\n\r\nTT\n>\n>last"
+    yield "ACG\nT\n>named\nGG"
+    for _ in range(30):
+        lines = []
+        for _ in range(rng.randint(1, 6)):
+            if rng.random() < 0.4:
+                lines.append(">" + "".join(rng.choice("abc xy") for _ in range(rng.randint(0, 12))))
+            else:
+                lines.append("".join(rng.choice("ACGTacgt \t") for _ in range(rng.randint(0, 15))))
+        yield rng.choice(["\n", "\r\n"]).join(lines) + rng.choice(["", "\n"])
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 5, 8, 1 << 20])
+def test_reader_matches_whole_file_parse(tmp_path, chunk_size):
+    rng = random.Random(chunk_size)
+    for index, text in enumerate(fasta_texts(rng)):
+        path = tmp_path / f"{index}.fa"
+        path.write_bytes(text.encode())
+        records = [(name, "".join(chunks)) for name, chunks in FastaReader(str(path), chunk_size).records()]
+        assert records == parse(text), text
+
+# The windows slicing the whole sequence gives: full windows every `stride`
+# residues, then with `partial` one shorter window over what they left out.
+def windows(sequence, window, stride, partial):
+    result = []
+    start = 0
+    covered = 0
+    while start + window <= len(sequence):
+        result.append((start, sequence[start:start + window]))
+        covered = start + window
+        start += stride
+    if partial and start < len(sequence) and covered < len(sequence):
+        result.append((start, sequence[start:]))
+    return result
+
+def test_sliding_windows_match_slicing():
+    rng = random.Random(1)
+    for _ in range(300):
+        sequence = "".join(rng.choice("ACGT") for _ in range(rng.randint(0, 40)))
+        window = rng.randint(1, 9)
+        stride = rng.randint(1, 12)
+        partial = rng.random() < 0.5
+        chunks = []
+        position = 0
+        while position < len(sequence):
+            size = rng.randint(1, 5)
+            chunks.append(sequence[position:position + size])
+            position += size
+        assert list(sliding_windows(iter(chunks), window, stride, partial)) == windows(sequence, window, stride, partial)
+
+def test_sliding_windows_reject_empty_steps():
+    with pytest.raises(ValueError):
+        list(sliding_windows(["ACGT"], 0))
+    with pytest.raises(ValueError):
+        list(sliding_windows(["ACGT"], 2, 0))
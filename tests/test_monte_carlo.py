@@ -0,0 +1,51 @@
+import random
+
+from gene_sequence import AlphaBetaPruning, BoosterAlphaBeta, MonteCarloSolver, UtilityCalculator, UtilityWithBooster
+
+# MonteCarloSolver against the exact solvers on small pools. Averaged playouts do
+# not always settle on the minimax line, even with the whole tree expanded, so
+# only most scores have to match; every line must be a legal ordering of the pool
+# scored the way the utility calculator scores it.
+
+def instances(seed, count):
+    rng = random.Random(seed)
+    for _ in range(count):
+        pool = [rng.choice("ATGCS") for _ in range(rng.randint(1, 5))]
+        target = "".join(rng.choice("ATGC") for _ in range(rng.randint(1, 6)))
+        weights = [rng.randint(1, 9) for _ in range(8)]
+        yield pool, target, weights
+
+def solvers(pool, target, weights):
+    utility = UtilityCalculator(target, weights)
+    yield utility, False, AlphaBetaPruning(list(pool), utility).solve()
+    utility = UtilityWithBooster(target, weights, multiplier = 0.5)
+    yield utility, True, BoosterAlphaBeta(list(pool), utility, True).run_solver()
+
+# The booster is on from the first "S" once the maximizer has placed one.
+def line_score(utility, booster_enabled, sequence):
+    if not booster_enabled:
+        return utility.calculate(sequence)
+    triggered = any(sequence[i] == "S" for i in range(0, len(sequence), 2))
+    booster_index = sequence.index("S") if triggered else None
+    return UtilityWithBooster(utility.target_sequence, utility.weights, booster_index, utility.multiplier).calculate(sequence)
+
+def test_monte_carlo_agrees_with_exact_solvers():
+    matches = 0
+    total = 0
+    for pool, target, weights in instances(1, 40):
+        for utility, booster_enabled, (exact_score, _) in solvers(pool, target, weights):
+            score, sequence = MonteCarloSolver(list(pool), utility, booster_enabled, node_limit = 2000, seed = 7).solve()
+            assert sorted(sequence) == sorted(pool)
+            assert score == line_score(utility, booster_enabled, sequence)
+            matches += score == exact_score
+            total += 1
+    assert matches >= 0.9 * total
+
+def test_monte_carlo_is_reproducible_with_a_seed():
+    for pool, target, weights in instances(2, 10):
+        for utility, booster_enabled, _ in solvers(pool, target, weights):
+            runs = []
+            for _ in range(2):
+                solver = MonteCarloSolver(list(pool), utility, booster_enabled, node_limit = 300, seed = 11)
+                runs.append((solver.solve(), solver.nodes, solver.visits, solver.confidence))
+            assert runs[0] == runs[1]
@@ -0,0 +1,17 @@
+import pytest
+
+from gene_sequence import GeneSequence, MultiTargetGeneSequence
+
+pytest.importorskip("numpy")
+
+# Each target gets what its own GeneSequence returns, ties included. With float
+# weights a line stored below one prefix may not be the first best below another.
+@pytest.mark.parametrize("pool, targets, weights", [
+    (list("CTAGC"), ["TTGCT", "GCAT"], [4, 0.7, 1.5, 0.3, 0.3, 7, 0.3, 0.3]),
+    (list("GATACAC"), ["TGTTCGT", "TGTTCGA"], [0.3, 0.1, 5, 7, 0.1, 0.1, 0.3, 0.1]),
+    (list("CCCAAT"), ["ACTGGC", "ACTGGG", "AC"], [6, 1.5, 6, 4, 7, -1, 0.7, 0.7]),
+    (list("ATGCATGC"), ["GCATGCAT", "GCAAGCAT", "GCAT"], [2, 3, 1, 8, 8, 8, 1, 1]),
+])
+def test_matches_separate_solves(pool, targets, weights):
+    expected = [GeneSequence(list(pool), target, weights).solve() for target in targets]
+    assert MultiTargetGeneSequence(list(pool), targets, weights).solve() == expected
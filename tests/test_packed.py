@@ -0,0 +1,44 @@
+import itertools
+import random
+
+import pytest
+
+from gene_sequence import Alphabet
+
+# encode() and decode() must round-trip every sequence, including ones that start
+# with the alphabet's first symbol (digit 0) and the empty one, whichever path
+# the alphabet's digit width takes.
+ALPHABETS = [
+    ("ATGC", 2),
+    ("ATGCS", 3),
+    ("ATGCSRYK", 3),
+    ("ATGCSRYKMWBDHVN-", 4),
+    ("ABCDEFGHIJKLMNOPQRSTUVWXYZ012345", 5),
+    ("ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456", 6),
+]
+
+@pytest.mark.parametrize("symbols, bits", ALPHABETS, ids = [symbols for symbols, _ in ALPHABETS])
+def test_round_trip(symbols, bits):
+    alphabet = Alphabet(symbols)
+    assert alphabet.bits == bits
+    for length in range(4):
+        for sequence in itertools.product(alphabet.symbols, repeat = length):
+            text = "".join(sequence)
+            assert alphabet.decode(alphabet.encode(text), length) == text
+    rng = random.Random(bits)
+    for _ in range(200):
+        text = "".join(rng.choice(symbols) for _ in range(rng.randint(0, 40)))
+        code = alphabet.encode(text)
+        assert code < 1 << bits * len(text)
+        assert alphabet.decode(code, len(text)) == text
+
+# Up to 5 bits encode() goes through int(); the code is still one digit per
+# symbol, first symbol most significant.
+@pytest.mark.parametrize("symbols, bits", ALPHABETS[:4], ids = [symbols for symbols, _ in ALPHABETS[:4]])
+def test_encode_matches_digits(symbols, bits):
+    alphabet = Alphabet(symbols)
+    text = alphabet.symbols[::-1] + alphabet.symbols
+    code = 0
+    for symbol in text:
+        code = code << bits | alphabet.digits[symbol]
+    assert alphabet.encode(text) == code
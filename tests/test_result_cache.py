@@ -0,0 +1,32 @@
+import json
+
+from gene_sequence import GeneBoosterRunner, ResultCache, solve_job
+
+# A cache hit searches nothing, so both kinds of job report 0 nodes and cached.
+WEIGHTS = [2, 3, 1, 8, 8, 8, 1, 1]
+
+def solve_twice(job, path):
+    return solve_job(0, json.dumps(job), path), solve_job(0, json.dumps(job), path)
+
+def test_gene_sequence_hit_reports_no_nodes(tmp_path):
+    first, second = solve_twice({"pool": ["A", "T", "C", "G"], "target": "GCAT", "weights": WEIGHTS}, str(tmp_path / "results.db"))
+    assert (first["cached"], second["cached"]) == (False, True)
+    assert first["nodes"] > 0 and second["nodes"] == 0
+    assert (second["score"], second["best_sequence"]) == (first["score"], first["best_sequence"])
+
+def test_booster_hit_reports_no_nodes(tmp_path):
+    job = {"pool": ["S", "A", "T", "G", "C"], "target": "GCAT", "weights": WEIGHTS, "booster": True}
+    first, second = solve_twice(job, str(tmp_path / "results.db"))
+    assert (first["cached"], second["cached"]) == (False, True)
+    for name in ("without_s", "with_s"):
+        assert first[name]["nodes"] > 0 and second[name]["nodes"] == 0
+        assert (second[name]["score"], second[name]["best_sequence"]) == (first[name]["score"], first[name]["best_sequence"])
+    assert second["verdict"] == first["verdict"]
+
+# Verified hits are searched again and report that search.
+def test_verified_booster_hit_reports_its_nodes(tmp_path):
+    cache = ResultCache(str(tmp_path / "results.db"))
+    runners = [GeneBoosterRunner(["S", "A", "T", "G"], "GCAT", WEIGHTS, cache = cache, verify_cache = True) for _ in range(2)]
+    results = [runner.analyse() for runner in runners]
+    assert runners[1].cached
+    assert results[1]["with_s"]["nodes"] == results[0]["with_s"]["nodes"] > 0
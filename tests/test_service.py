@@ -0,0 +1,86 @@
+import asyncio
+import json
+import os
+import signal
+
+from gene_sequence.batch import solve_record
+from gene_sequence.service import SolveService, request, serve
+
+# Runs `exchange(service, address)` against a service on a Unix socket in tmp_path.
+def with_service(tmp_path, exchange, **options):
+    async def main():
+        service = SolveService(**options)
+        address = f"unix:{tmp_path / 'service.sock'}"
+        ready = asyncio.Event()
+        server = asyncio.ensure_future(serve(service, address, lambda _: ready.set()))
+        await ready.wait()
+        try:
+            return await exchange(service, address)
+        finally:
+            server.cancel()
+            await asyncio.gather(server, return_exceptions = True)
+    return asyncio.run(main())
+
+JOB = {"pool": "ATCG", "target": "GCAT", "weights": [2, 3, 1, 8, 8, 8, 1, 1]}
+# Long enough to still be running when its short timeout expires.
+SLOW_JOB = {"pool": "ATGCRYKMWBS", "target": "GCATGCATGCAT", "weights": [2.5, 3, 1, 8, 8, 8, 1, 1, 0.3, 7, 2], "booster": True, "multiplier": 0.23}
+
+def test_solve(tmp_path):
+    async def exchange(service, address):
+        return await request(address, dict(JOB, id = 1))
+    response, = with_service(tmp_path, exchange, workers = 1)
+    expected = solve_record(0, JOB)
+    assert response["status"] == "ok" and response["id"] == 1
+    assert (response["best_sequence"], response["score"]) == (expected["best_sequence"], expected["score"])
+
+# Ending the input right after a cancel still answers every request.
+def test_cancel_then_end_of_input(tmp_path):
+    async def exchange(service, address):
+        reader, writer = await asyncio.open_unix_connection(address[len("unix:"):])
+        writer.write(json.dumps(dict(SLOW_JOB, id = 1)).encode() + b"\n")
+        writer.write(json.dumps(dict(JOB, id = 3)).encode() + b"\n")
+        writer.write(json.dumps({"id": 2, "op": "cancel", "cancel": 1}).encode() + b"\n")
+        await writer.drain()
+        writer.write_eof()
+        lines = []
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            lines.append(line)
+        writer.close()
+        return lines
+    lines = with_service(tmp_path, exchange, workers = 1)
+    responses = sorted((json.loads(line) for line in lines), key = lambda response: response["id"])
+    assert [response["status"] for response in responses] == ["cancelled", "ok", "ok"]
+
+# A search that times out while running keeps its worker and is reported.
+def test_timed_out_search_is_reported_as_abandoned(tmp_path):
+    async def exchange(service, address):
+        await request(address, dict(JOB, id = 0))
+        timed_out, = await request(address, dict(SLOW_JOB, id = 1, timeout = 0.3))
+        stats, = await request(address, {"id": 2, "op": "stats"})
+        return timed_out, stats["stats"]
+    timed_out, stats = with_service(tmp_path, exchange, workers = 1)
+    assert timed_out["status"] == "timeout"
+    assert stats["counts"]["abandoned"] == 1
+    assert stats["abandoned"] == 1 and stats["in_flight"] == 0
+
+# A worker that dies breaks the pool; the service replaces it and keeps serving.
+def test_dead_worker_is_replaced(tmp_path):
+    async def exchange(service, address):
+        first, = await request(address, dict(JOB, id = 1))
+        for pid in list(service.executor._processes):
+            os.kill(pid, signal.SIGKILL)
+        responses = [first]
+        for request_id in (2, 3):
+            responses += await request(address, dict(JOB, id = request_id))
+        stats, = await request(address, {"id": 4, "op": "stats"})
+        return responses, stats["stats"]
+    responses, stats = with_service(tmp_path, exchange, workers = 1)
+    assert responses[0]["status"] == "ok"
+    # The search sent while the pool was still being found broken may fail.
+    assert responses[1]["status"] == "ok" or "BrokenProcessPool" in responses[1]["error"]
+    assert responses[2]["status"] == "ok"
+    assert responses[2]["score"] == responses[0]["score"]
+    assert stats["counts"]["restarts"] == 1
@@ -0,0 +1,19 @@
+import pytest
+
+from gene_sequence import AlphaBetaPruning, SearchStats, UtilityCalculator
+
+pytest.importorskip("numpy")
+
+# A leaf batch counts at the depth of the node it resolves, not as a leaf.
+def test_leaf_batches_count_at_their_depth():
+    pool = list("ATGCATG")
+    stats = SearchStats()
+    AlphaBetaPruning(pool, UtilityCalculator("GCATTA", [2, 3, 1, 8, 8, 8, 1, 1]), stats = stats, leaf_batch = 3).solve()
+    report = stats.as_dict()
+    batches = report["leaf_batches_per_depth"]
+    assert sum(batches) > 0
+    # Only nodes with at most 3 symbols left are batched, and leaves never are.
+    assert not any(batches[:len(pool) - 3]) and batches[len(pool)] == 0
+    assert report["leaves_per_depth"][-1] == 0
+    for depth in range(len(pool)):
+        assert batches[depth] <= report["nodes_per_depth"][depth]
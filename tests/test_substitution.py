@@ -0,0 +1,108 @@
+import random
+
+import pytest
+
+from gene_sequence import (AlphaBetaPruning, BoosterAlphaBeta, SubstitutionMatrix, TranspositionTable, UtilityCalculator, UtilityWithBooster,
+                           substitution_matrix)
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+needs_numpy = pytest.mark.skipif(numpy is None, reason = "needs NumPy")
+
+# A non-default matrix must score the same through calculate(), calculate_batch()
+# and the search. All three are checked against a brute-force minimax that scores
+# every leaf from pair_cost() alone.
+
+MATRICES = [
+    "transition-transversion",
+    # Asymmetric, a negative cost, float costs, and a gap and match that are not 0.
+    SubstitutionMatrix({"AC": 0.7, "GT": 2.25, "SA": -0.5, "CG": 3}, default = 1.5, gap = 3.1, match = 0.25, symmetric = False),
+]
+
+OPTIONS = [
+    {},
+    {"bound_pruning": True},
+    pytest.param({"leaf_batch": 3}, marks = needs_numpy),
+    {"transposition_table": "packed"},
+]
+
+def leaf(matrix, sequence, target, weights, booster_index = None, multiplier = None):
+    utility = 0
+    for i in range(max(len(sequence), len(target))):
+        gene = ord(sequence[i]) if i < len(sequence) else 0
+        code = ord(target[i]) if i < len(target) else 0
+        weight = weights[i] if i < len(weights) else 1
+        if i < len(weights) and booster_index is not None and i >= booster_index:
+            weight *= multiplier
+        utility -= weight * matrix.pair_cost(gene, code)
+    return utility if multiplier is None else round(utility, 2)
+
+# Best score over every order of play, the maximizer placing first.
+def minimax(pool, score, sequence = "", maximizing = True):
+    if not pool:
+        return score(sequence)
+    values = [minimax(pool[:i] + pool[i + 1:], score, sequence + pool[i], not maximizing) for i in range(len(pool))]
+    return max(values) if maximizing else min(values)
+
+def instances(seed, count):
+    rng = random.Random(seed)
+    for _ in range(count):
+        pool = [rng.choice("ATGCS") for _ in range(rng.randint(1, 6))]
+        target = "".join(rng.choice("ATGC") for _ in range(rng.choice([0, rng.randint(1, 7)])))
+        weights = [rng.choice([rng.randint(-1, 8), rng.choice([0.1, 0.3, 1.5, 2.25])]) for _ in range(rng.randint(0, 8))]
+        yield pool, target, weights, rng.choice([1.0, 0.23, 0.7, 1.1])
+
+def engine_options(options):
+    options = dict(options)
+    if options.get("transposition_table") == "packed":
+        options["transposition_table"] = TranspositionTable(packed = True)
+    return options
+
+@pytest.mark.parametrize("spec", MATRICES, ids = ["transition-transversion", "custom"])
+def test_calculate_matches_pair_costs(spec):
+    matrix = substitution_matrix(spec)
+    rng = random.Random(11)
+    for pool, target, weights, multiplier in instances(11, 60):
+        booster_index = rng.choice([None, rng.randint(0, 6)])
+        plain = UtilityCalculator(target, weights, spec)
+        boosted = UtilityWithBooster(target, weights, booster_index, multiplier, spec)
+        for candidate in ["".join(rng.choice("ATGCS") for _ in range(rng.randint(0, 9))) for _ in range(8)]:
+            assert plain.calculate(candidate) == leaf(matrix, candidate, target, weights)
+            assert plain.calculate(list(candidate)) == leaf(matrix, candidate, target, weights)
+            assert boosted.calculate(candidate) == leaf(matrix, candidate, target, weights, booster_index, multiplier)
+
+@needs_numpy
+@pytest.mark.parametrize("spec", MATRICES, ids = ["transition-transversion", "custom"])
+def test_calculate_batch_matches_pair_costs(spec):
+    matrix = substitution_matrix(spec)
+    rng = random.Random(12)
+    for pool, target, weights, multiplier in instances(12, 60):
+        booster_index = rng.choice([None, rng.randint(0, 6)])
+        candidates = ["".join(rng.choice("ATGCS") for _ in range(rng.randint(0, 9))) for _ in range(rng.randint(1, 10))]
+        batch = UtilityCalculator(target, weights, spec).calculate_batch(candidates)
+        assert batch.tolist() == [leaf(matrix, candidate, target, weights) for candidate in candidates]
+        batch = UtilityWithBooster(target, weights, booster_index, multiplier, spec).calculate_batch(candidates)
+        assert batch.tolist() == [leaf(matrix, candidate, target, weights, booster_index, multiplier) for candidate in candidates]
+
+@pytest.mark.parametrize("options", OPTIONS, ids = lambda options: ",".join(options) or "default")
+@pytest.mark.parametrize("spec", MATRICES, ids = ["transition-transversion", "custom"])
+def test_search_matches_brute_force(spec, options):
+    matrix = substitution_matrix(spec)
+    for pool, target, weights, multiplier in instances(13, 40):
+        expected = minimax(pool, lambda sequence: leaf(matrix, sequence, target, weights))
+        score, best_sequence = AlphaBetaPruning(list(pool), UtilityCalculator(target, weights, spec), **engine_options(options)).solve()
+        assert score == expected, (pool, target, weights)
+        assert leaf(matrix, best_sequence, target, weights) == expected and sorted(best_sequence) == sorted(pool)
+
+        for booster_enabled in (True, False):
+            def boosted(sequence):
+                booster_index = sequence.index("S") if booster_enabled and "S" in sequence[::2] else None
+                return leaf(matrix, sequence, target, weights, booster_index, multiplier)
+            expected = minimax(pool, boosted)
+            solver = BoosterAlphaBeta(list(pool), UtilityWithBooster(target, weights, multiplier = multiplier, matrix = spec), booster_enabled, **engine_options(options))
+            score, best_sequence = solver.run_solver()
+            assert score == expected, (pool, target, weights, multiplier, booster_enabled)
+            assert boosted(best_sequence) == expected and sorted(best_sequence) == sorted(pool)
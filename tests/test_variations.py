@@ -0,0 +1,63 @@
+import random
+
+import pytest
+
+from gene_sequence import AlphaBetaPruning, BoosterAlphaBeta, UtilityCalculator, UtilityWithBooster
+
+# Brute force: every line the maximizer can steer to while the minimizer keeps
+# the minimax value of each of its nodes, one per distinct symbol played.
+def minimax(pool, prefix, leaf):
+    if not pool:
+        return leaf(prefix)
+    values = [minimax(pool[:i] + pool[i + 1:], prefix + pool[i], leaf) for i in range(len(pool))]
+    return max(values) if len(prefix) % 2 == 0 else min(values)
+
+def all_lines(pool, prefix, leaf):
+    if not pool:
+        return [(leaf(prefix), prefix)]
+    value = minimax(pool, prefix, leaf)
+    lines = []
+    for symbol in sorted(set(pool)):
+        rest = list(pool)
+        rest.remove(symbol)
+        rest = "".join(rest)
+        if len(prefix) % 2 == 1 and minimax(rest, prefix + symbol, leaf) != value:
+            continue
+        lines.extend(all_lines(rest, prefix + symbol, leaf))
+    return lines
+
+def booster_leaf(utility):
+    def leaf(sequence):
+        triggered = any(sequence[i] == "S" for i in range(0, len(sequence), 2))
+        booster_index = sequence.index("S") if triggered else None
+        return UtilityWithBooster(utility.target_sequence, utility.weights, booster_index, utility.multiplier).calculate(sequence)
+    return leaf
+
+def instances(seed, count):
+    rng = random.Random(seed)
+    for _ in range(count):
+        pool = [rng.choice("ATGCS") for _ in range(rng.randint(1, 6))]
+        target = "".join(rng.choice("ATGC") for _ in range(rng.randint(0, 6)))
+        weights = [rng.choice([rng.randint(0, 5), 0.5, 1.5]) for _ in range(rng.randint(0, 7))]
+        if rng.random() < 0.5:
+            utility = UtilityCalculator(target, weights)
+            yield pool, lambda: AlphaBetaPruning(list(pool), utility), utility.calculate
+        else:
+            utility = UtilityWithBooster(target, weights, multiplier = rng.choice([0.5, 1.5]))
+            yield pool, lambda: BoosterAlphaBeta(list(pool), utility, True), booster_leaf(utility)
+
+@pytest.mark.parametrize("seed", [1, 2])
+def test_variations_match_brute_force(seed):
+    for pool, make_solver, leaf in instances(seed, 40):
+        solver = make_solver()
+        results = list(solver.variations())
+        scores = [score for score, _ in results]
+        assert scores == sorted(scores, reverse = True)
+        assert sorted(results) == sorted(all_lines("".join(pool), "", leaf))
+        fresh = make_solver()
+        assert results[0] == (fresh.solve() if isinstance(fresh, AlphaBetaPruning) else fresh.run_solver())
+
+        assert list(solver.variations(max_results = 3)) == results[:3]
+        assert list(solver.variations(max_results = 0)) == []
+        floor = scores[len(scores) // 2]
+        assert list(solver.variations(floor = floor)) == [result for result in results if result[0] >= floor]